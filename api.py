@@ -1,7 +1,9 @@
 from __future__ import annotations
 import asyncio
+import os
 import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 import webview
@@ -13,6 +15,44 @@ from core.dependencies import DependencyChecker
 from core.models import AppConfig, ProcessingStatus, ProcessingState
 from core.prompts import PromptBuilder
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Per-run loops use uvloop when installed; the global policy is left alone
+_create_event_loop = uvloop.new_event_loop if uvloop is not None else asyncio.new_event_loop
+
+
+# Default executor threads for to_thread work in processing loops:
+# metadata extraction, image encoding and video frame reads
+DEFAULT_OFFLOAD_POOL_SIZE = 32
+
+
+def _offload_pool_size() -> int:
+    """Read PYNAME_OFFLOAD_POOL, falling back to the default if it is unset or invalid."""
+    try:
+        return max(1, int(os.environ.get("PYNAME_OFFLOAD_POOL", DEFAULT_OFFLOAD_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_OFFLOAD_POOL_SIZE
+
+
+OFFLOAD_POOL_SIZE = _offload_pool_size()
+
+
+def _new_processing_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create and install an event loop with a sized default executor.
+    
+    The executor is per loop because loop.close() shuts it down.
+    """
+    loop = _create_event_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=OFFLOAD_POOL_SIZE, thread_name_prefix="offload")
+    )
+    asyncio.set_event_loop(loop)
+    return loop
+
 
 class API:
     """
@@ -22,9 +62,10 @@ class API:
     Long-running operations spawn threads with their own event loops.
     """
     
-    def __init__(self):
+    def __init__(self, config_manager: ConfigManager | None = None):
         self._window: webview.Window | None = None
-        self._config_manager = ConfigManager()
+        # Share the caller's manager so its cached config sees saves made here
+        self._config_manager = config_manager or ConfigManager()
         self._history_manager = HistoryManager()
         self._processor: FileProcessor | None = None
         self._processing_thread: threading.Thread | None = None
@@ -103,7 +144,7 @@ class API:
             data = json.loads(config_json)
             
             def run():
-                loop = asyncio.new_event_loop()
+                loop = _create_event_loop()
                 asyncio.set_event_loop(loop)
                 try:
                     config = AppConfig(**data)
@@ -158,8 +199,7 @@ class API:
     
     def _run_processing(self, file_paths: list[Path]) -> None:
         """Run processing in a separate thread with its own event loop."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        loop = _new_processing_loop()
         
         try:
             config = self._config_manager.get_runtime_sync()
@@ -216,8 +256,7 @@ class API:
             return json.dumps({"error": "No processor available"})
         
         def run():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            loop = _new_processing_loop()
             
             try:
                 from core.models import FileProcessingResult
@@ -261,7 +300,7 @@ class API:
     def get_history(self) -> str:
         """Get processing history."""
         def run():
-            loop = asyncio.new_event_loop()
+            loop = _create_event_loop()
             asyncio.set_event_loop(loop)
             try:
                 history = loop.run_until_complete(self._history_manager.load_history())
@@ -274,7 +313,7 @@ class API:
     def undo_last_batch(self) -> str:
         """Undo the most recent batch operation."""
         def run():
-            loop = asyncio.new_event_loop()
+            loop = _create_event_loop()
             asyncio.set_event_loop(loop)
             try:
                 batch = loop.run_until_complete(self._history_manager.get_last_batch())
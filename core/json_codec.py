@@ -0,0 +1,51 @@
+"""JSON helpers for provider payloads, using orjson when it is installed."""
+
+import functools
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: str | bytes):
+    """
+    Parse JSON from a str or UTF-8 bytes.
+    
+    Raises json.JSONDecodeError on invalid input with either backend
+    (orjson's error type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, ready to send as a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@functools.cache
+def _load_repair_json():
+    try:
+        from json_repair import repair_json
+    except ImportError:
+        return None
+    return repair_json
+
+
+def repair_json(text: str) -> str:
+    """
+    Repair malformed LLM JSON; json_repair is only imported on first use.
+    
+    Raises ValueError if json_repair is not installed.
+    """
+    repair = _load_repair_json()
+    if repair is None:
+        raise ValueError(
+            f"Could not parse LLM response as JSON (json-repair not installed): {text[:200]}"
+        )
+    return repair(text)
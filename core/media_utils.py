@@ -9,8 +9,16 @@ import re
 import shutil
 import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
@@ -18,8 +26,12 @@ from pathlib import Path
 
 IMAGE_MAX_DIM = 1024
 VIDEO_FRAME_MAX_DIM = 768
+VIDEO_FRAME_WORKERS = 4  # Concurrent ffmpeg processes per video
 JPEG_QUALITY = 85
 
+# Recently encoded downscaled JPEGs, reused on retries; a few hundred KB each
+ENCODED_IMAGE_CACHE_SIZE = 16
+
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif", ".tiff", ".bmp"}
 
@@ -77,6 +89,18 @@ def is_video_file(extension: str) -> bool:
 # Image Encoding
 # ─────────────────────────────────────────────────────────────────────────────
 
+def b64encode_str(data: bytes) -> str:
+    """Base64-encode bytes to str, using pybase64's SIMD codec when installed."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+# Keyed by (path, mtime_ns, size, max_dim, quality) so edited files re-encode
+_encoded_image_cache: OrderedDict[tuple, tuple[str, str]] = OrderedDict()
+_encoded_image_lock = threading.Lock()
+
+
 async def encode_image_optimized(
     file_path: Path,
     max_dim: int = IMAGE_MAX_DIM,
@@ -99,34 +123,82 @@ async def encode_image_optimized(
         Tuple of (base64_data, media_type)
     """
     def read_and_encode():
-        try:
-            from PIL import Image, ImageOps
-        except ImportError:
-            return _encode_image_raw(file_path)
+        return _encode_image_cached(file_path, max_dim, quality)
+
+    return await asyncio.to_thread(read_and_encode)
 
-        try:
-            with Image.open(file_path) as img:
-                # Apply EXIF rotation
-                img = ImageOps.exif_transpose(img)
-                
-                # Convert to RGB if necessary
-                if img.mode not in ("RGB", "L"):
-                    img = img.convert("RGB")
-                
-                # Resize if larger than max dimension
-                max_side = max(img.size)
-                if max_side > max_dim:
-                    img.thumbnail((max_dim, max_dim), Image.LANCZOS)
-                
-                # Encode to JPEG
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=quality, optimize=True)
-                return base64.b64encode(buffer.getvalue()).decode("utf-8"), "image/jpeg"
-        except Exception:
-            return _encode_image_raw(file_path)
-
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, read_and_encode)
+
+def _encode_image_cached(file_path: Path, max_dim: int, quality: int) -> tuple[str, str]:
+    """
+    Synchronous optimized image encoding through the recent-encodings cache.
+    
+    Only downscaled PIL output is cached; raw fallbacks are whole files and
+    are returned without being kept.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return _encode_image_pil(file_path, max_dim, quality) or _encode_image_raw(file_path)
+    key = (str(file_path), stat.st_mtime_ns, stat.st_size, max_dim, quality)
+    with _encoded_image_lock:
+        cached = _encoded_image_cache.get(key)
+        if cached is not None:
+            _encoded_image_cache.move_to_end(key)
+            return cached
+    encoded = _encode_image_pil(file_path, max_dim, quality)
+    if encoded is None:
+        return _encode_image_raw(file_path)
+    with _encoded_image_lock:
+        _encoded_image_cache[key] = encoded
+        if len(_encoded_image_cache) > ENCODED_IMAGE_CACHE_SIZE:
+            _encoded_image_cache.popitem(last=False)
+    return encoded
+
+
+def _encode_image_pil(file_path: Path, max_dim: int, quality: int) -> tuple[str, str] | None:
+    """Synchronous optimized image encoding; None if PIL is missing or fails."""
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(file_path) as img:
+            # Apply EXIF rotation
+            img = ImageOps.exif_transpose(img)
+            
+            # Convert to RGB if necessary
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            
+            # Resize if larger than max dimension
+            max_side = max(img.size)
+            if max_side > max_dim:
+                img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+            
+            # Encode to JPEG
+            buffer = io.BytesIO()
+            img.save(buffer, format="JPEG", quality=quality, optimize=True)
+            return b64encode_str(buffer.getvalue()), "image/jpeg"
+    except Exception:
+        return None
+
+
+async def encode_image_data_url(
+    file_path: Path,
+    max_dim: int = IMAGE_MAX_DIM,
+    quality: int = JPEG_QUALITY
+) -> str:
+    """
+    Encode image as a base64 data URL for OpenAI-style image_url fields.
+    
+    The URL is assembled in the worker thread, off the event loop.
+    """
+    def read_and_encode():
+        data, media_type = _encode_image_cached(file_path, max_dim, quality)
+        return "".join(("data:", media_type, ";base64,", data))
+
+    return await asyncio.to_thread(read_and_encode)
 
 
 async def encode_image_raw(file_path: Path) -> tuple[str, str]:
@@ -138,15 +210,14 @@ async def encode_image_raw(file_path: Path) -> tuple[str, str]:
     def read_and_encode():
         return _encode_image_raw(file_path)
     
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, read_and_encode)
+    return await asyncio.to_thread(read_and_encode)
 
 
 def _encode_image_raw(file_path: Path) -> tuple[str, str]:
     """Synchronous raw image encoding."""
     media_type = mimetypes.guess_type(str(file_path))[0] or "image/jpeg"
     with open(file_path, "rb") as f:
-        encoded = base64.b64encode(f.read()).decode("utf-8")
+        encoded = b64encode_str(f.read())
     return encoded, media_type
 
 
@@ -158,7 +229,8 @@ async def extract_video_frames(
     file_path: Path,
     frame_count: int,
     duration_seconds: float | None = None,
-    max_dim: int = VIDEO_FRAME_MAX_DIM
+    max_dim: int = VIDEO_FRAME_MAX_DIM,
+    as_data_url: bool = False
 ) -> list[str]:
     """
     Extract video frames as base64-encoded JPEGs.
@@ -170,6 +242,7 @@ async def extract_video_frames(
         frame_count: Number of frames to extract
         duration_seconds: Video duration (if known, avoids extra ffprobe call)
         max_dim: Maximum frame dimension
+        as_data_url: Return "data:image/jpeg;base64,..." URLs instead of bare base64
     
     Returns:
         List of base64-encoded JPEG frames
@@ -182,42 +255,55 @@ async def extract_video_frames(
     base_dir = Path("data") / "tmp"
     base_dir.mkdir(parents=True, exist_ok=True)
     timestamps = sample_video_timestamps(duration_seconds, frame_count)
+    if not timestamps:
+        return []
+
+    scale = (
+        f"scale='if(gt(iw,ih),min({max_dim},iw),-2)':"
+        f"'if(gt(iw,ih),-2,min({max_dim},ih))'"
+    )
+    prefix = "data:image/jpeg;base64," if as_data_url else ""
+
+    def _extract_one(temp_path: Path, index: int, timestamp: float) -> str | None:
+        output_path = temp_path / f"frame_{index:02d}.jpg"
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-y",
+            "-ss", f"{timestamp:.2f}",
+            "-i", str(file_path),
+            "-frames:v", "1",
+            "-vf", scale,
+            str(output_path)
+        ]
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+        if not output_path.exists():
+            return None
+        # Encode in the worker thread as soon as the frame is read
+        try:
+            return prefix + b64encode_str(output_path.read_bytes())
+        except OSError:
+            return None
 
     def _extract():
-        frames: list[bytes] = []
+        # Each frame is an independent ffmpeg seek, so run them side by side
+        workers = min(len(timestamps), VIDEO_FRAME_WORKERS)
         with tempfile.TemporaryDirectory(dir=base_dir, prefix="video_frames_") as tmpdir:
             temp_path = Path(tmpdir)
-            for index, timestamp in enumerate(timestamps, start=1):
-                output_path = temp_path / f"frame_{index:02d}.jpg"
-                scale = (
-                    f"scale='if(gt(iw,ih),min({max_dim},iw),-2)':"
-                    f"'if(gt(iw,ih),-2,min({max_dim},ih))'"
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    _extract_one,
+                    [temp_path] * len(timestamps),
+                    range(1, len(timestamps) + 1),
+                    timestamps
                 )
-                cmd = [
-                    "ffmpeg",
-                    "-hide_banner",
-                    "-loglevel", "error",
-                    "-y",
-                    "-ss", f"{timestamp:.2f}",
-                    "-i", str(file_path),
-                    "-frames:v", "1",
-                    "-vf", scale,
-                    str(output_path)
-                ]
-                try:
-                    subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
-                if output_path.exists():
-                    try:
-                        frames.append(output_path.read_bytes())
-                    except OSError:
-                        continue
-        return frames
-
-    loop = asyncio.get_event_loop()
-    frames = await loop.run_in_executor(None, _extract)
-    return [base64.b64encode(frame).decode("utf-8") for frame in frames]
+                return [frame for frame in results if frame is not None]
+
+    return await asyncio.to_thread(_extract)
 
 
 def sample_video_timestamps(
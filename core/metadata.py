@@ -141,8 +141,7 @@ class MetadataExtractor:
             
             return metadata
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _extract)
+        return await asyncio.to_thread(_extract)
     
     def _convert_gps(self, coord: tuple, ref: str) -> float:
         """Convert GPS coordinates to decimal degrees."""
@@ -230,8 +229,7 @@ class MetadataExtractor:
             
             return metadata
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _extract)
+        return await asyncio.to_thread(_extract)
 
     async def _extract_content(
         self,
@@ -297,8 +295,7 @@ class MetadataExtractor:
             except OSError:
                 return None, False
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _read)
+        return await asyncio.to_thread(_read)
 
     async def _read_pdf_excerpt(
         self,
@@ -347,8 +344,7 @@ class MetadataExtractor:
             truncated = truncated_by_length or total_chars > max_chars or len(parts) < len(reader.pages)
             return text, truncated
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _extract)
+        return await asyncio.to_thread(_extract)
 
     async def _read_markitdown_excerpt(
         self,
@@ -381,8 +377,7 @@ class MetadataExtractor:
 
             return text
 
-        loop = asyncio.get_event_loop()
-        text = await loop.run_in_executor(None, _extract)
+        text = await asyncio.to_thread(_extract)
         return self._truncate_text(text, max_chars)
 
     async def _read_textutil_excerpt(
@@ -405,8 +400,7 @@ class MetadataExtractor:
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 return None
 
-        loop = asyncio.get_event_loop()
-        text = await loop.run_in_executor(None, _extract)
+        text = await asyncio.to_thread(_extract)
         return self._truncate_text(text, max_chars)
 
     @staticmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
+from functools import cached_property
 from pydantic import BaseModel, Field, field_validator, computed_field
-from typing import Literal
+from typing import ClassVar, Literal
 from pathlib import Path
 from datetime import datetime
 from enum import Enum
@@ -49,7 +50,54 @@ class ImageMode(str, Enum):
 # Metadata Models
 # ─────────────────────────────────────────────────────────────────────────────
 
-class ImageMetadata(BaseModel):
+# Minute-resolution timestamp format shown in prompts
+SHORT_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+class _DerivedCacheModel(BaseModel):
+    """
+    Base for models with cached_property values computed from their fields.
+    
+    Cached values are dropped when a field is assigned and when the model is
+    copied (model_copy, copy.copy, copy.deepcopy), so they are recomputed
+    from the new field values. Mutating a field in place, e.g. appending to
+    a list, is not detected; assign a new value instead.
+    """
+    _cached_names: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._cached_names = tuple(
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, cached_property)
+        )
+
+    def _clear_derived(self) -> None:
+        """Drop cached values computed from fields."""
+        instance_dict = self.__dict__
+        for name in self._cached_names:
+            instance_dict.pop(name, None)
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._clear_derived()
+
+    def __copy__(self):
+        copied = super().__copy__()
+        copied._clear_derived()
+        return copied
+
+    def __deepcopy__(self, memo=None):
+        copied = super().__deepcopy__(memo)
+        copied._clear_derived()
+        return copied
+
+
+class ImageMetadata(_DerivedCacheModel):
     """Extracted image metadata."""
     date_taken: datetime | None = None
     camera_make: str | None = None
@@ -63,8 +111,13 @@ class ImageMetadata(BaseModel):
     width: int | None = None
     height: int | None = None
 
+    @cached_property
+    def date_taken_short(self) -> str | None:
+        """date_taken in SHORT_DATE_FORMAT, formatted once."""
+        return self.date_taken.strftime(SHORT_DATE_FORMAT) if self.date_taken else None
+
 
-class VideoMetadata(BaseModel):
+class VideoMetadata(_DerivedCacheModel):
     """Extracted video metadata."""
     duration_seconds: float | None = None
     width: int | None = None
@@ -74,8 +127,13 @@ class VideoMetadata(BaseModel):
     fps: float | None = None
     creation_time: datetime | None = None
 
+    @cached_property
+    def creation_time_short(self) -> str | None:
+        """creation_time in SHORT_DATE_FORMAT, formatted once."""
+        return self.creation_time.strftime(SHORT_DATE_FORMAT) if self.creation_time else None
+
 
-class FileMetadata(BaseModel):
+class FileMetadata(_DerivedCacheModel):
     """Combined file metadata."""
     file_path: Path
     file_name: str
@@ -107,6 +165,26 @@ class FileMetadata(BaseModel):
             size /= 1024
         return f"{size:.1f} TB"
 
+    @cached_property
+    def _prompt_fields(self) -> dict[str, str]:
+        """Stringified override-template fields, filled on first prompt render."""
+        return {}
+
+    @cached_property
+    def neighbor_names_top5(self) -> tuple[str, ...]:
+        """First five neighbor names as listed in prompts."""
+        return tuple(self.neighbor_names[:5])
+
+    @cached_property
+    def created_at_short(self) -> str:
+        """created_at in SHORT_DATE_FORMAT, formatted once."""
+        return self.created_at.strftime(SHORT_DATE_FORMAT)
+
+    @cached_property
+    def modified_at_short(self) -> str:
+        """modified_at in SHORT_DATE_FORMAT, formatted once."""
+        return self.modified_at.strftime(SHORT_DATE_FORMAT)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # LLM Response Models
@@ -292,6 +370,14 @@ class PromptSection(BaseModel):
     document: str | None = None
     generic: str | None = None
 
+    @field_validator("image", "video", "document", "generic")
+    @classmethod
+    def strip_override(cls, v: str | None) -> str | None:
+        """Store overrides pre-stripped; blank overrides become None."""
+        if v is None:
+            return None
+        return v.strip() or None
+
 
 class PromptOverrides(BaseModel):
     """Optional prompt overrides."""
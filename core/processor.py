@@ -290,6 +290,8 @@ class FileProcessor:
         """
         approved = [r for r in results if r.status == "approved"]
         operations: list[RenameOperation] = []
+        # Tags are applied in bulk after all renames, one `tag` call per tag set
+        pending_tags: list[tuple[Path, list[str]]] = []
         
         for index, result in enumerate(approved):
             if on_progress:
@@ -302,19 +304,13 @@ class FileProcessor:
                 # Perform rename
                 result.original_path.rename(result.new_path)
                 
-                # Apply tags if enabled
+                # Queue tags if enabled
                 if (
                     self.config.processing.auto_apply_tags
                     and result.apply_tags
                     and result.tags
                 ):
-                    tag_mode = self.config.processing.tag_mode
-                    tag_mode_value = tag_mode.value if hasattr(tag_mode, "value") else str(tag_mode)
-                    await self.tagger.apply_tags(
-                        result.new_path,
-                        result.tags,
-                        mode=tag_mode_value
-                    )
+                    pending_tags.append((result.new_path, result.tags))
                 
                 # Record operation
                 operations.append(RenameOperation(
@@ -335,11 +331,16 @@ class FileProcessor:
                 result.status = "failed"
                 result.error_message = str(e)
         
-        # Save to history
+        # Save to history before tagging so renames can always be undone
         batch = HistoryBatch(
             batch_id=str(uuid.uuid4()),
             operations=operations
         )
         await self.history.save_batch(batch)
         
+        if pending_tags:
+            tag_mode = self.config.processing.tag_mode
+            tag_mode_value = tag_mode.value if hasattr(tag_mode, "value") else str(tag_mode)
+            await self.tagger.apply_tags_bulk(pending_tags, mode=tag_mode_value)
+        
         return batch
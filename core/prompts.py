@@ -5,96 +5,263 @@ Each prompt is designed to extract the most relevant naming information
 based on what data is available for that file type.
 """
 
-from pathlib import Path
+import functools
+import re
 from .models import FileMetadata, PromptOverrides
 
 
+# Video filename patterns, scanned in one pass. Each alternative sits inside a
+# lookahead so a match (e.g. "IMG_20240101") doesn't hide an overlapping one.
+_VIDEO_NAME_FLAGS = re.compile(
+    r"(?=(?P<auto>IMG_\d+|DSC\d+|MOV_\d+|VID_\d+)"
+    r"|(?i:(?P<screen>screen.?record|capture|screenshot))"
+    r"|(?i:(?P<call>zoom|meet|teams|webex))"
+    r"|(?P<date>\d{4}[-_]?\d{2}[-_]?\d{2})"
+    r"|(?i:(?P<edited>edit|final|v\d+|draft)))"
+)
+_VIDEO_FLAG_BITS = {"auto": 1, "screen": 2, "call": 4, "date": 8, "edited": 16}
+_VIDEO_FLAGS_ALL = 31
+_VIDEO_FLAG_MESSAGES = (
+    "Camera auto-generated name (not descriptive)",
+    "Likely a screen recording",
+    "Likely a video call recording",
+    "Contains a date",
+    "Appears to be an edited/versioned file",
+)
+
+# "## Current File" line groups; one element in the sections list, since the
+# prompt is "\n".joined anyway
+_VIDEO_FILE_INFO = "- Size: %s\n- Created: %s\n- Modified: %s"
+_DOCUMENT_FILE_INFO = "- Type: %s document\n- Size: %s\n- Created: %s\n- Last modified: %s"
+_GENERIC_FILE_INFO = "- Type: %s\n- Size: %s\n- Created: %s"
+
+# Extension -> prompt type; anything else is "generic"
+_EXT_TO_TYPE: dict[str, str] = {
+    **dict.fromkeys((".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif", ".tiff", ".bmp"), "image"),
+    **dict.fromkeys((".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v", ".wmv", ".flv"), "video"),
+    **dict.fromkeys((".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+                     ".txt", ".md", ".rtf", ".csv", ".odt", ".ods", ".odp"), "document"),
+}
+
+# Document type line per extension, already formatted as a bullet
+_DOC_TYPE_HINTS: dict[str, str] = {
+    ext: f"- {hint}" for ext, hint in {
+        ".pdf": "PDF - could be any document type (report, form, ebook, scan, etc.)",
+        ".docx": "Word document - typically letters, reports, essays, or documentation",
+        ".doc": "Legacy Word document - typically letters, reports, essays",
+        ".xlsx": "Excel spreadsheet - typically data, budgets, lists, or calculations",
+        ".xls": "Legacy Excel spreadsheet - typically data, budgets, lists",
+        ".pptx": "PowerPoint presentation - typically slides for meetings or talks",
+        ".ppt": "Legacy PowerPoint presentation",
+        ".txt": "Plain text file - notes, logs, code, or simple documents",
+        ".md": "Markdown file - documentation, notes, or formatted text",
+        ".rtf": "Rich text file - formatted document, often exported from other apps",
+        ".csv": "CSV file - tabular data, exports, or data transfers",
+    }.items()
+}
+
+# Document filename analysis patterns. These stay as separate searches: a
+# fused lookahead scan (as in _VIDEO_NAME_FLAGS) measured 1.1-3.5x slower
+# here, since each category reports only its first match and most stems hit
+# several categories; a consuming alternation would hide overlapping matches
+# (e.g. the date inside "v2024-01-15").
+_DOC_DATE_RE = re.compile(r'(\d{4}[-_/]?\d{2}[-_/]?\d{2}|\d{2}[-_/]\d{2}[-_/]\d{4})')
+_DOC_VERSION_RE = re.compile(r'(v\d+|version.?\d+|final|draft|revised|updated)', re.I)
+_DOC_COPY_RE = re.compile(r'copy|копия|\(\d+\)|duplicate', re.I)
+_DOC_TYPE_RE = re.compile(
+    r'(invoice|receipt|report|letter|resume|cv|contract|agreement|'
+    r'proposal|presentation|meeting|notes|minutes|budget|schedule|'
+    r'plan|guide|manual|handbook|policy|form|application|certificate|'
+    r'transcript|statement|summary|analysis|review)',
+    re.I
+)
+_DOC_PERSON_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+_DOC_GENERIC_RE = re.compile(r'^(document|file|scan|img|untitled|new)', re.I)
+
+
+# Minimum frame height for each video resolution label, highest first
+_RESOLUTION_LABELS = ((2160, "4K"), (1080, "1080p"), (720, "720p"))
+
+
+def _resolution_label(height: int) -> str:
+    for min_height, label in _RESOLUTION_LABELS:
+        if height >= min_height:
+            return label
+    return "SD"
+
+
+def _aspect_hint(aspect: float) -> str:
+    """Describe a width/height ratio; bounds are exclusive."""
+    if aspect > 1.7:
+        return "widescreen/cinematic"
+    if aspect < 0.7:
+        return "vertical/mobile"
+    if 0.9 < aspect < 1.1:
+        return "square"
+    return "standard"
+
+
+def _document_name_observations(stem: str) -> list[str]:
+    """Notes on what a document's filename stem suggests."""
+    # Extract potential meaningful parts
+    observations = []
+
+    # Check for dates
+    date_match = _DOC_DATE_RE.search(stem)
+    if date_match:
+        observations.append(f"Contains date: {date_match.group(1)}")
+
+    # Check for version indicators
+    version_match = _DOC_VERSION_RE.search(stem)
+    if version_match:
+        observations.append(f"Version indicator: {version_match.group(1)}")
+
+    # Check for copy indicators
+    if _DOC_COPY_RE.search(stem):
+        observations.append("Appears to be a copy/duplicate")
+
+    # Check for common document types in name
+    doc_type_match = _DOC_TYPE_RE.search(stem)
+    if doc_type_match:
+        observations.append(f"Document type indicator: {doc_type_match.group(1)}")
+
+    # Check for names/entities
+    if _DOC_PERSON_RE.search(stem):
+        observations.append("May contain person or company names")
+
+    # Check for auto-generated names
+    if _DOC_GENERIC_RE.search(stem):
+        observations.append("Generic/auto-generated name (needs better description)")
+
+    return observations
+
+
+def _file_stem(name: str) -> str:
+    """Path(name).stem for a bare file name, without building a Path."""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[:dot]
+    return name
+
+
+class _SafeFormatDict(dict):
+    """format_map() mapping that renders unknown placeholders as ""."""
+
+    def __missing__(self, key):
+        return ""
+
+
+def _number(value) -> str:
+    return f"{value}" if value else ""
+
+
+# Override-template placeholders; each is computed on first use per file
+_TEMPLATE_GETTERS = {
+    "file_name": lambda m: m.file_name if m.include_current_filename else "",
+    "extension": lambda m: m.extension,
+    "size_human": lambda m: m.size_human,
+    "created_at": lambda m: m.created_at.isoformat(),
+    "modified_at": lambda m: m.modified_at.isoformat(),
+    "parent_folder_name": lambda m: m.parent_folder_name or "",
+    "folder_context": lambda m: m.folder_context or "",
+    "neighbor_names": lambda m: "\n".join(m.neighbor_names),
+    "neighbor_names_csv": lambda m: ", ".join(m.neighbor_names),
+    "content_excerpt": lambda m: m.content_excerpt or "",
+    "content_source": lambda m: m.content_source or "",
+    "content_truncated": lambda m: "true" if m.content_truncated else "",
+    "tag_count": lambda m: f"{m.tag_count}" if m.tag_count is not None else "",
+    "tag_prompt": lambda m: m.tag_prompt or "",
+    "video_extract_count": lambda m: _number(m.video_extract_count),
+}
+
+# Placeholders read from metadata.image / metadata.video; all render as ""
+# when that part of the metadata is missing, without calling the getter
+_IMAGE_GETTERS = {
+    "image_date_taken": lambda i: i.date_taken.isoformat() if i.date_taken else "",
+    "image_camera_make": lambda i: i.camera_make or "",
+    "image_camera_model": lambda i: i.camera_model or "",
+    "image_lens_model": lambda i: i.lens_model or "",
+    "image_gps_latitude": lambda i: _number(i.gps_latitude),
+    "image_gps_longitude": lambda i: _number(i.gps_longitude),
+    "image_width": lambda i: _number(i.width),
+    "image_height": lambda i: _number(i.height),
+}
+_VIDEO_GETTERS = {
+    "video_duration_seconds": lambda v: _number(v.duration_seconds),
+    "video_width": lambda v: _number(v.width),
+    "video_height": lambda v: _number(v.height),
+    "video_codec": lambda v: v.codec or "",
+    "video_fps": lambda v: _number(v.fps),
+}
+
+
+class _TemplateContext(_SafeFormatDict):
+    """
+    Lazy template context: fields are formatted only when a template asks.
+    
+    Formatted values are kept in metadata._prompt_fields, which is cleared
+    with the model's other cached values on field assignment and copy.
+    """
+
+    def __init__(self, metadata: FileMetadata):
+        super().__init__()
+        self._metadata = metadata
+        self._fields = metadata._prompt_fields
+
+    def __missing__(self, key):
+        value = self._fields.get(key)
+        if value is not None:
+            return value
+        metadata = self._metadata
+        getter = _TEMPLATE_GETTERS.get(key)
+        if getter is not None:
+            value = getter(metadata)
+        elif key in _IMAGE_GETTERS:
+            image = metadata.image
+            value = _IMAGE_GETTERS[key](image) if image is not None else ""
+        elif key in _VIDEO_GETTERS:
+            video = metadata.video
+            value = _VIDEO_GETTERS[key](video) if video is not None else ""
+        else:
+            return ""
+        self._fields[key] = value
+        return value
+
+
 class PromptBuilder:
     """Build optimized prompts for different file types."""
 
     @classmethod
     def _prompt_type(cls, metadata: FileMetadata) -> str:
-        ext = metadata.extension.lower()
-        if ext in {".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif", ".tiff", ".bmp"}:
-            return "image"
-        if ext in {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v", ".wmv", ".flv"}:
-            return "video"
-        if ext in {".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-                   ".txt", ".md", ".rtf", ".csv", ".odt", ".ods", ".odp"}:
-            return "document"
-        return "generic"
+        return _EXT_TO_TYPE.get(metadata.extension.lower(), "generic")
 
     @classmethod
     def _render_template(cls, template: str, metadata: FileMetadata) -> str:
-        context = cls._template_context(metadata)
-
-        class _SafeDict(dict):
-            def __missing__(self, key):
-                return ""
-
-        return template.format_map(_SafeDict(context))
-
-    @classmethod
-    def _template_context(cls, metadata: FileMetadata) -> dict[str, str]:
-        image = metadata.image
-        video = metadata.video
-        neighbor_names = metadata.neighbor_names or []
-        file_name = metadata.file_name if metadata.include_current_filename else ""
-        tag_count = metadata.tag_count
-        return {
-            "file_name": file_name,
-            "extension": metadata.extension,
-            "size_human": metadata.size_human,
-            "created_at": metadata.created_at.isoformat(),
-            "modified_at": metadata.modified_at.isoformat(),
-            "parent_folder_name": metadata.parent_folder_name or "",
-            "folder_context": metadata.folder_context or "",
-            "neighbor_names": "\n".join(neighbor_names),
-            "neighbor_names_csv": ", ".join(neighbor_names),
-            "content_excerpt": metadata.content_excerpt or "",
-            "content_source": metadata.content_source or "",
-            "content_truncated": "true" if metadata.content_truncated else "",
-            "tag_count": f"{tag_count}" if tag_count is not None else "",
-            "tag_prompt": metadata.tag_prompt or "",
-            "video_extract_count": f"{metadata.video_extract_count}" if metadata.video_extract_count else "",
-            "image_date_taken": image.date_taken.isoformat() if image and image.date_taken else "",
-            "image_camera_make": (image.camera_make or "") if image else "",
-            "image_camera_model": (image.camera_model or "") if image else "",
-            "image_lens_model": (image.lens_model or "") if image else "",
-            "image_gps_latitude": f"{image.gps_latitude}" if image and image.gps_latitude else "",
-            "image_gps_longitude": f"{image.gps_longitude}" if image and image.gps_longitude else "",
-            "image_width": f"{image.width}" if image and image.width else "",
-            "image_height": f"{image.height}" if image and image.height else "",
-            "video_duration_seconds": f"{video.duration_seconds}" if video and video.duration_seconds else "",
-            "video_width": f"{video.width}" if video and video.width else "",
-            "video_height": f"{video.height}" if video and video.height else "",
-            "video_codec": (video.codec or "") if video else "",
-            "video_fps": f"{video.fps}" if video and video.fps else "",
-        }
+        # Static overrides need neither the context nor a format pass
+        if "{" not in template and "}" not in template:
+            return template
+        return template.format_map(_TemplateContext(metadata))
 
     @classmethod
     def get_system_prompt(cls, metadata: FileMetadata, overrides: PromptOverrides | None = None) -> str:
         prompt_type = cls._prompt_type(metadata)
         if overrides:
             override = getattr(overrides.system, prompt_type, None)
-            if override and override.strip():
-                return override.strip()
+            if override:
+                return override
+        return cls._default_system_prompt(prompt_type)
 
-        if prompt_type == "image":
-            return cls.SYSTEM_PROMPT_IMAGE
-        if prompt_type == "video":
-            return cls.SYSTEM_PROMPT_VIDEO
-        if prompt_type == "document":
-            return cls.SYSTEM_PROMPT_DOCUMENT
-        return cls.SYSTEM_PROMPT_BASE
+    @classmethod
+    def _default_system_prompt(cls, prompt_type: str) -> str:
+        return cls._DEFAULT_SYSTEM_PROMPTS.get(prompt_type, cls.SYSTEM_PROMPT_BASE)
 
     @classmethod
     def get_user_prompt(cls, metadata: FileMetadata, overrides: PromptOverrides | None = None) -> str:
         prompt_type = cls._prompt_type(metadata)
         if overrides:
             override = getattr(overrides.user, prompt_type, None)
-            if override and override.strip():
-                return cls._render_template(override.strip(), metadata)
+            if override:
+                return cls._render_template(override, metadata)
 
         if prompt_type == "image":
             return cls.build_image_prompt(metadata)
@@ -114,15 +281,12 @@ class PromptBuilder:
     def _append_folder_context(cls, sections: list[str], metadata: FileMetadata) -> None:
         if not metadata.folder_context:
             return
-        sections.append("")
-        sections.append("## Folder Context")
-        sections.append(f"- {metadata.folder_context}")
+        sections.extend(("", "## Folder Context", f"- {metadata.folder_context}"))
 
     @classmethod
     def _append_content_excerpt(cls, sections: list[str], metadata: FileMetadata) -> None:
         if not metadata.content_excerpt:
             return
-        sections.append("")
         label = "## Content Excerpt"
         details: list[str] = []
         if metadata.content_source:
@@ -132,25 +296,42 @@ class PromptBuilder:
             details.append("truncated")
         if details:
             label = f"{label} ({', '.join(details)})"
-        sections.append(label)
-        sections.append(metadata.content_excerpt)
+        sections.extend(("", label, metadata.content_excerpt))
+
+    # Tag count lines for the common cases; other counts are formatted on demand
+    _TAG_LINES_STATIC: dict[int | None, str] = {
+        None: "- Suggest relevant Finder tags for {subject}.",
+        0: "- Return an empty tags array.",
+        1: "- Suggest 1 Finder tag.",
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _tag_guidance_block(tag_count: int | None, tag_prompt: str, subject: str) -> tuple[str, ...]:
+        if tag_count is not None and tag_count < 0:
+            tag_count = 0
+        line = PromptBuilder._TAG_LINES_STATIC.get(tag_count) or f"- Suggest up to {tag_count} Finder tags."
+        lines = ["", "## Tag Guidance", line.replace("{subject}", subject)]
+        if tag_prompt:
+            lines.append(f"- Tag guidance: {tag_prompt}")
+        return tuple(lines)
 
     @classmethod
-    def _tag_guidance_lines(cls, metadata: FileMetadata, subject: str) -> list[str]:
-        lines: list[str] = []
-        tag_count = metadata.tag_count
-        if tag_count is None:
-            lines.append(f"- Suggest relevant Finder tags for {subject}.")
-        elif tag_count <= 0:
-            lines.append("- Return an empty tags array.")
-        elif tag_count == 1:
-            lines.append("- Suggest 1 Finder tag.")
-        else:
-            lines.append(f"- Suggest up to {tag_count} Finder tags.")
+    def _append_tag_guidance(cls, sections: list[str], metadata: FileMetadata, subject: str) -> None:
+        # Siblings in a bulk run share tag settings, so the block is memoized
         tag_prompt = (metadata.tag_prompt or "").strip()
-        if tag_prompt:
-            lines.append(f"- Tag guidance: {tag_prompt}")
-        return lines
+        sections.extend(cls._tag_guidance_block(metadata.tag_count, tag_prompt, subject))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _neighbor_block(header: str, names: tuple[str, ...]) -> tuple[str, ...]:
+        return ("", header, *[f"- {name}" for name in names])
+
+    @classmethod
+    def _append_neighbors(cls, sections: list[str], metadata: FileMetadata, header: str) -> None:
+        # Every file in a folder lists the same neighbors; memoize the lines
+        if metadata.neighbor_names:
+            sections.extend(cls._neighbor_block(header, metadata.neighbor_names_top5))
     
     # ─────────────────────────────────────────────────────────────────────────
     # System Prompts
@@ -247,10 +428,83 @@ Analysis priorities:
 For messy filenames: Extract any meaningful components.
 For business documents: Consider date-type-subject ordering."""
 
+    _DEFAULT_SYSTEM_PROMPTS = {
+        "image": SYSTEM_PROMPT_IMAGE,
+        "video": SYSTEM_PROMPT_VIDEO,
+        "document": SYSTEM_PROMPT_DOCUMENT,
+    }
+
     # ─────────────────────────────────────────────────────────────────────────
     # User Prompts
     # ─────────────────────────────────────────────────────────────────────────
-    
+
+    # Instruction blocks, precomputed for each include_current_filename setting
+    _IMAGE_TASK_LINES = (
+        "",
+        "## Your Task",
+        "1. Describe what you see in the image",
+        "2. Identify the main subject, scene, or activity",
+        "3. Consider the metadata for additional context (date, location, camera)",
+        "4. Match the naming style of neighboring files if a pattern exists",
+    )
+
+    _VIDEO_TASK_LINES = {
+        True: (
+            "",
+            "## Your Task",
+            "1. Analyze the filename and metadata for clues about content",
+            "2. Consider the duration and format (screen recording? phone video? professional?)",
+            "3. If the current name has meaningful parts, preserve or improve them",
+            "4. Match the naming style of neighboring files if appropriate",
+            "",
+        ),
+        False: (
+            "",
+            "## Your Task",
+            "1. Analyze the metadata and context for clues about content",
+            "2. Consider the duration and format (screen recording? phone video? professional?)",
+            "3. Use the available context to craft a clear descriptive name",
+            "4. Match the naming style of neighboring files if appropriate",
+            "",
+        ),
+    }
+
+    _DOCUMENT_TASK_LINES = {
+        True: (
+            "",
+            "## Your Task",
+            "1. Analyze the current filename for any meaningful information",
+            "2. Consider the document type and typical naming conventions",
+            "3. If it's auto-generated or messy, suggest a cleaner descriptive name",
+            "4. If it contains useful info (dates, types, names), preserve and organize it",
+            "5. Match the naming style of neighboring files if a pattern exists",
+            "",
+        ),
+        False: (
+            "",
+            "## Your Task",
+            "1. Analyze the metadata for any meaningful information",
+            "2. Consider the document type and typical naming conventions",
+            "3. If it's auto-generated or messy, suggest a cleaner descriptive name",
+            "4. Use any available context to form a clear descriptive name",
+            "5. Match the naming style of neighboring files if a pattern exists",
+            "",
+        ),
+    }
+
+    # Keyed by (include_current_filename, has_content_excerpt)
+    _DOCUMENT_NOTES = {
+        (True, True): "NOTE: A content excerpt is included above. Use it as the primary signal.",
+        (False, True): "NOTE: A content excerpt is included above. Use it as the primary signal.",
+        (True, False): "NOTE: You cannot read the document content. Base your suggestion on filename and metadata only.",
+        (False, False): "NOTE: You cannot read the document content. Base your suggestion on metadata and context only.",
+    }
+
+    _GENERIC_TASK_LINES = {
+        True: ("", "Suggest a clear, descriptive name based on the current filename and context."),
+        False: ("", "Suggest a clear, descriptive name based on the available context."),
+    }
+
     @classmethod
     def build_image_prompt(cls, metadata: FileMetadata) -> str:
         """
@@ -263,69 +517,56 @@ For business documents: Consider date-type-subject ordering."""
             "",
             "## Current File",
         ]
+        append = sections.append
         filename_line = cls._filename_line(metadata, "Filename")
         if filename_line:
-            sections.append(filename_line)
-        sections.append(f"- Size: {metadata.size_human}")
+            append(filename_line)
+        append(f"- Size: {metadata.size_human}")
         if metadata.parent_folder_name:
-            sections.append(f"- Folder: {metadata.parent_folder_name}")
+            append(f"- Folder: {metadata.parent_folder_name}")
         cls._append_folder_context(sections, metadata)
         
         # Add image-specific metadata
         if metadata.image:
             img = metadata.image
-            sections.append("")
-            sections.append("## Image Metadata")
+            sections.extend(("", "## Image Metadata"))
             
             if img.date_taken:
-                sections.append(f"- Date taken: {img.date_taken.strftime('%Y-%m-%d %H:%M')}")
+                append(f"- Date taken: {img.date_taken_short}")
             
-            if img.camera_make or img.camera_model:
-                camera = " ".join(filter(None, [img.camera_make, img.camera_model]))
-                sections.append(f"- Camera: {camera}")
+            make, model = img.camera_make, img.camera_model
+            if make and model:
+                append(f"- Camera: {make} {model}")
+            elif make or model:
+                append(f"- Camera: {make or model}")
             
             if img.lens_model:
-                sections.append(f"- Lens: {img.lens_model}")
+                append(f"- Lens: {img.lens_model}")
             
             if img.focal_length:
-                sections.append(f"- Focal length: {img.focal_length}mm")
+                append(f"- Focal length: {img.focal_length}mm")
             
             if img.aperture:
-                sections.append(f"- Aperture: f/{img.aperture}")
+                append(f"- Aperture: f/{img.aperture}")
             
             if img.iso:
-                sections.append(f"- ISO: {img.iso}")
+                append(f"- ISO: {img.iso}")
             
             if img.gps_latitude and img.gps_longitude:
-                sections.append(f"- GPS coordinates: {img.gps_latitude:.4f}, {img.gps_longitude:.4f}")
+                append(f"- GPS coordinates: {img.gps_latitude:.4f}, {img.gps_longitude:.4f}")
             
             if img.width and img.height:
                 orientation = "landscape" if img.width > img.height else "portrait" if img.height > img.width else "square"
-                sections.append(f"- Dimensions: {img.width}x{img.height} ({orientation})")
+                append(f"- Dimensions: {img.width}x{img.height} ({orientation})")
         
         # Add neighbor context
-        if metadata.neighbor_names:
-            sections.append("")
-            sections.append("## Other Files in Folder (for naming convention reference)")
-            for name in metadata.neighbor_names[:5]:
-                sections.append(f"- {name}")
+        cls._append_neighbors(sections, metadata, "## Other Files in Folder (for naming convention reference)")
 
         cls._append_content_excerpt(sections, metadata)
         
         # Instructions
-        sections.extend([
-            "",
-            "## Your Task",
-            "1. Describe what you see in the image",
-            "2. Identify the main subject, scene, or activity",
-            "3. Consider the metadata for additional context (date, location, camera)",
-            "4. Match the naming style of neighboring files if a pattern exists",
-        ])
-        tag_lines = cls._tag_guidance_lines(metadata, "this image")
-        if tag_lines:
-            sections.append("")
-            sections.append("## Tag Guidance")
-            sections.extend(tag_lines)
+        sections.extend(cls._IMAGE_TASK_LINES)
+        cls._append_tag_guidance(sections, metadata, "this image")
         
         return "\n".join(sections)
     
@@ -342,23 +583,23 @@ For business documents: Consider date-type-subject ordering."""
             "",
             "## Current File",
         ]
+        append = sections.append
         filename_line = cls._filename_line(metadata, "Filename")
         if filename_line:
-            sections.append(filename_line)
-        sections.extend([
-            f"- Size: {metadata.size_human}",
-            f"- Created: {metadata.created_at.strftime('%Y-%m-%d %H:%M')}",
-            f"- Modified: {metadata.modified_at.strftime('%Y-%m-%d %H:%M')}",
-        ])
+            append(filename_line)
+        append(_VIDEO_FILE_INFO % (
+            metadata.size_human,
+            metadata.created_at_short,
+            metadata.modified_at_short,
+        ))
         if metadata.parent_folder_name:
-            sections.append(f"- Folder: {metadata.parent_folder_name}")
+            append(f"- Folder: {metadata.parent_folder_name}")
         cls._append_folder_context(sections, metadata)
         
         # Add video-specific metadata
         if metadata.video:
             vid = metadata.video
-            sections.append("")
-            sections.append("## Video Metadata")
+            sections.extend(("", "## Video Metadata"))
             
             if vid.duration_seconds:
                 mins, secs = divmod(int(vid.duration_seconds), 60)
@@ -369,44 +610,25 @@ For business documents: Consider date-type-subject ordering."""
                     duration_str = f"{mins}m {secs}s"
                 else:
                     duration_str = f"{secs}s"
-                sections.append(f"- Duration: {duration_str}")
+                append(f"- Duration: {duration_str}")
                 
                 # Add duration context
                 if vid.duration_seconds < 30:
-                    sections.append("  (Very short - likely a clip, reaction, or quick capture)")
+                    append("  (Very short - likely a clip, reaction, or quick capture)")
                 elif vid.duration_seconds < 180:
-                    sections.append("  (Short - likely a clip or highlight)")
+                    append("  (Short - likely a clip or highlight)")
                 elif vid.duration_seconds < 1800:
-                    sections.append("  (Medium - could be a segment or short video)")
+                    append("  (Medium - could be a segment or short video)")
                 else:
-                    sections.append("  (Long - likely a full recording or movie)")
+                    append("  (Long - likely a full recording or movie)")
             
             if vid.width and vid.height:
-                # Determine format type
-                aspect = vid.width / vid.height if vid.height else 0
-                if aspect > 1.7:
-                    format_hint = "widescreen/cinematic"
-                elif aspect < 0.7:
-                    format_hint = "vertical/mobile"
-                elif 0.9 < aspect < 1.1:
-                    format_hint = "square"
-                else:
-                    format_hint = "standard"
-                
-                # Resolution label
-                if vid.height >= 2160:
-                    res_label = "4K"
-                elif vid.height >= 1080:
-                    res_label = "1080p"
-                elif vid.height >= 720:
-                    res_label = "720p"
-                else:
-                    res_label = "SD"
-                
-                sections.append(f"- Resolution: {vid.width}x{vid.height} ({res_label}, {format_hint})")
+                res_label = _resolution_label(vid.height)
+                format_hint = _aspect_hint(vid.width / vid.height)
+                append(f"- Resolution: {vid.width}x{vid.height} ({res_label}, {format_hint})")
             
             if vid.codec:
-                sections.append(f"- Codec: {vid.codec}")
+                append(f"- Codec: {vid.codec}")
             
             if vid.fps:
                 fps_note = ""
@@ -414,59 +636,39 @@ For business documents: Consider date-type-subject ordering."""
                     fps_note = " (slow-motion capable)"
                 elif vid.fps < 25:
                     fps_note = " (cinematic/timelapse)"
-                sections.append(f"- Frame rate: {vid.fps} fps{fps_note}")
+                append(f"- Frame rate: {vid.fps} fps{fps_note}")
             
             if vid.creation_time:
-                sections.append(f"- Recording date: {vid.creation_time.strftime('%Y-%m-%d %H:%M')}")
+                append(f"- Recording date: {vid.creation_time_short}")
         
         # Filename analysis
         if metadata.include_current_filename:
-            sections.append("")
-            sections.append("## Filename Analysis")
-
-            original_stem = Path(metadata.file_name).stem
-
-            # Check for common patterns in original filename
-            patterns_found = []
-
-            import re
-            if re.search(r'IMG_\d+|DSC\d+|MOV_\d+|VID_\d+', original_stem):
-                patterns_found.append("Camera auto-generated name (not descriptive)")
-            if re.search(r'screen.?record|capture|screenshot', original_stem, re.I):
-                patterns_found.append("Likely a screen recording")
-            if re.search(r'zoom|meet|teams|webex', original_stem, re.I):
-                patterns_found.append("Likely a video call recording")
-            if re.search(r'\d{4}[-_]?\d{2}[-_]?\d{2}', original_stem):
-                patterns_found.append("Contains a date")
-            if re.search(r'edit|final|v\d+|draft', original_stem, re.I):
-                patterns_found.append("Appears to be an edited/versioned file")
-
-            if patterns_found:
-                for pattern in patterns_found:
-                    sections.append(f"- {pattern}")
+            sections.extend(("", "## Filename Analysis"))
+
+            original_stem = _file_stem(metadata.file_name)
+
+            # Check for common patterns in original filename; nothing can
+            # match an empty stem
+            flags = 0
+            if original_stem:
+                for match in _VIDEO_NAME_FLAGS.finditer(original_stem):
+                    flags |= _VIDEO_FLAG_BITS[match.lastgroup]
+                    if flags == _VIDEO_FLAGS_ALL:
+                        break
+
+            if flags:
+                for bit, message in enumerate(_VIDEO_FLAG_MESSAGES):
+                    if flags & (1 << bit):
+                        append(f"- {message}")
             else:
-                sections.append(f"- Original name: {original_stem}")
+                append(f"- Original name: {original_stem}")
         
         # Add neighbor context
-        if metadata.neighbor_names:
-            sections.append("")
-            sections.append("## Other Files in Folder")
-            for name in metadata.neighbor_names[:5]:
-                sections.append(f"- {name}")
+        cls._append_neighbors(sections, metadata, "## Other Files in Folder")
 
         cls._append_content_excerpt(sections, metadata)
         
         # Instructions
-        filename_instruction = (
-            "1. Analyze the filename and metadata for clues about content"
-            if metadata.include_current_filename
-            else "1. Analyze the metadata and context for clues about content"
-        )
-        name_instruction = (
-            "3. If the current name has meaningful parts, preserve or improve them"
-            if metadata.include_current_filename
-            else "3. Use the available context to craft a clear descriptive name"
-        )
         video_note = "NOTE: You cannot see the video content. Base your suggestion on metadata and context only."
         if metadata.video_extract_count and metadata.video_extract_count > 0:
             video_note = (
@@ -474,21 +676,9 @@ For business documents: Consider date-type-subject ordering."""
                 "Use them as visual context."
             )
 
-        sections.extend([
-            "",
-            "## Your Task",
-            filename_instruction,
-            "2. Consider the duration and format (screen recording? phone video? professional?)",
-            name_instruction,
-            "4. Match the naming style of neighboring files if appropriate",
-            "",
-            video_note,
-        ])
-        tag_lines = cls._tag_guidance_lines(metadata, "this video")
-        if tag_lines:
-            sections.append("")
-            sections.append("## Tag Guidance")
-            sections.extend(tag_lines)
+        sections.extend(cls._VIDEO_TASK_LINES[metadata.include_current_filename])
+        append(video_note)
+        cls._append_tag_guidance(sections, metadata, "this video")
         
         return "\n".join(sections)
     
@@ -504,153 +694,69 @@ For business documents: Consider date-type-subject ordering."""
             "",
             "## Current File",
         ]
+        append = sections.append
         filename_line = cls._filename_line(metadata, "Filename")
         if filename_line:
-            sections.append(filename_line)
-        sections.extend([
-            f"- Type: {metadata.extension.upper()} document",
-            f"- Size: {metadata.size_human}",
-            f"- Created: {metadata.created_at.strftime('%Y-%m-%d %H:%M')}",
-            f"- Last modified: {metadata.modified_at.strftime('%Y-%m-%d %H:%M')}",
-        ])
+            append(filename_line)
+        append(_DOCUMENT_FILE_INFO % (
+            metadata.extension.upper(),
+            metadata.size_human,
+            metadata.created_at_short,
+            metadata.modified_at_short,
+        ))
         if metadata.parent_folder_name:
-            sections.append(f"- Folder: {metadata.parent_folder_name}")
+            append(f"- Folder: {metadata.parent_folder_name}")
         cls._append_folder_context(sections, metadata)
         
         # Document type hints
-        sections.append("")
-        sections.append("## Document Type Analysis")
+        sections.extend(("", "## Document Type Analysis"))
         
         ext = metadata.extension.lower()
-        type_hints = {
-            ".pdf": "PDF - could be any document type (report, form, ebook, scan, etc.)",
-            ".docx": "Word document - typically letters, reports, essays, or documentation",
-            ".doc": "Legacy Word document - typically letters, reports, essays",
-            ".xlsx": "Excel spreadsheet - typically data, budgets, lists, or calculations",
-            ".xls": "Legacy Excel spreadsheet - typically data, budgets, lists",
-            ".pptx": "PowerPoint presentation - typically slides for meetings or talks",
-            ".ppt": "Legacy PowerPoint presentation",
-            ".txt": "Plain text file - notes, logs, code, or simple documents",
-            ".md": "Markdown file - documentation, notes, or formatted text",
-            ".rtf": "Rich text file - formatted document, often exported from other apps",
-            ".csv": "CSV file - tabular data, exports, or data transfers",
-        }
-        sections.append(f"- {type_hints.get(ext, f'{ext} file')}")
+        append(_DOC_TYPE_HINTS.get(ext) or f"- {ext} file")
 
         cls._append_content_excerpt(sections, metadata)
         
         # Filename analysis
         if metadata.include_current_filename:
-            sections.append("")
-            sections.append("## Current Filename Analysis")
-
-            original_stem = Path(metadata.file_name).stem
-
-            import re
-
-            # Extract potential meaningful parts
-            observations = []
-
-            # Check for dates
-            date_match = re.search(r'(\d{4}[-_/]?\d{2}[-_/]?\d{2}|\d{2}[-_/]\d{2}[-_/]\d{4})', original_stem)
-            if date_match:
-                observations.append(f"Contains date: {date_match.group(1)}")
-
-            # Check for version indicators
-            version_match = re.search(r'(v\d+|version.?\d+|final|draft|revised|updated)', original_stem, re.I)
-            if version_match:
-                observations.append(f"Version indicator: {version_match.group(1)}")
-
-            # Check for copy indicators
-            if re.search(r'copy|копия|\(\d+\)|duplicate', original_stem, re.I):
-                observations.append("Appears to be a copy/duplicate")
-
-            # Check for common document types in name
-            doc_type_match = re.search(
-                r'(invoice|receipt|report|letter|resume|cv|contract|agreement|'
-                r'proposal|presentation|meeting|notes|minutes|budget|schedule|'
-                r'plan|guide|manual|handbook|policy|form|application|certificate|'
-                r'transcript|statement|summary|analysis|review)',
-                original_stem, re.I
-            )
-            if doc_type_match:
-                observations.append(f"Document type indicator: {doc_type_match.group(1)}")
+            sections.extend(("", "## Current Filename Analysis"))
 
-            # Check for names/entities
-            if re.search(r'[A-Z][a-z]+\s+[A-Z][a-z]+', original_stem):
-                observations.append("May contain person or company names")
+            original_stem = _file_stem(metadata.file_name)
 
-            # Check for auto-generated names
-            if re.search(r'^(document|file|scan|img|untitled|new)', original_stem, re.I):
-                observations.append("Generic/auto-generated name (needs better description)")
+            # No pattern can match an empty stem; skip the regex scans
+            observations = _document_name_observations(original_stem) if original_stem else []
 
             if observations:
                 for obs in observations:
-                    sections.append(f"- {obs}")
+                    append(f"- {obs}")
             else:
-                sections.append(f"- Filename: \"{original_stem}\" (analyze for meaningful content)")
+                append(f"- Filename: \"{original_stem}\" (analyze for meaningful content)")
         
         # Size-based hints
-        sections.append("")
-        sections.append("## Size Analysis")
+        sections.extend(("", "## Size Analysis"))
         
         size_mb = metadata.size_bytes / (1024 * 1024)
         if ext == ".pdf":
             if size_mb > 10:
-                sections.append("- Large PDF: Likely contains images, scans, or many pages")
+                append("- Large PDF: Likely contains images, scans, or many pages")
             elif size_mb < 0.1:
-                sections.append("- Small PDF: Likely a simple document or form")
+                append("- Small PDF: Likely a simple document or form")
             else:
-                sections.append("- Medium PDF: Standard document size")
+                append("- Medium PDF: Standard document size")
         elif ext in [".xlsx", ".xls"]:
             if size_mb > 5:
-                sections.append("- Large spreadsheet: Likely contains significant data")
+                append("- Large spreadsheet: Likely contains significant data")
         elif ext in [".pptx", ".ppt"]:
             if size_mb > 20:
-                sections.append("- Large presentation: Likely contains many slides or embedded media")
+                append("- Large presentation: Likely contains many slides or embedded media")
         
         # Add neighbor context
-        if metadata.neighbor_names:
-            sections.append("")
-            sections.append("## Other Files in Folder")
-            for name in metadata.neighbor_names[:5]:
-                sections.append(f"- {name}")
+        cls._append_neighbors(sections, metadata, "## Other Files in Folder")
         
         # Instructions
-        filename_instruction = (
-            "1. Analyze the current filename for any meaningful information"
-            if metadata.include_current_filename
-            else "1. Analyze the metadata for any meaningful information"
-        )
-        context_instruction = (
-            "4. If it contains useful info (dates, types, names), preserve and organize it"
-            if metadata.include_current_filename
-            else "4. Use any available context to form a clear descriptive name"
-        )
-        if metadata.content_excerpt:
-            note_line = "NOTE: A content excerpt is included above. Use it as the primary signal."
-        else:
-            note_line = (
-                "NOTE: You cannot read the document content. Base your suggestion on filename and metadata only."
-                if metadata.include_current_filename
-                else "NOTE: You cannot read the document content. Base your suggestion on metadata and context only."
-            )
-        sections.extend([
-            "",
-            "## Your Task",
-            filename_instruction,
-            "2. Consider the document type and typical naming conventions",
-            "3. If it's auto-generated or messy, suggest a cleaner descriptive name",
-            context_instruction,
-            "5. Match the naming style of neighboring files if a pattern exists",
-            "",
-            note_line,
-        ])
-        tag_lines = cls._tag_guidance_lines(metadata, "this document")
-        if tag_lines:
-            sections.append("")
-            sections.append("## Tag Guidance")
-            sections.extend(tag_lines)
+        include_filename = metadata.include_current_filename
+        sections.extend(cls._DOCUMENT_TASK_LINES[include_filename])
+        append(cls._DOCUMENT_NOTES[include_filename, bool(metadata.content_excerpt)])
+        cls._append_tag_guidance(sections, metadata, "this document")
         
         return "\n".join(sections)
     
@@ -676,36 +782,24 @@ For business documents: Consider date-type-subject ordering."""
             "",
             "## File Information",
         ]
+        append = sections.append
         filename_line = cls._filename_line(metadata, "Current name")
         if filename_line:
-            sections.append(filename_line)
-        sections.extend([
-            f"- Type: {metadata.extension}",
-            f"- Size: {metadata.size_human}",
-            f"- Created: {metadata.created_at.strftime('%Y-%m-%d %H:%M')}",
-        ])
+            append(filename_line)
+        append(_GENERIC_FILE_INFO % (
+            metadata.extension,
+            metadata.size_human,
+            metadata.created_at_short,
+        ))
         if metadata.parent_folder_name:
-            sections.append(f"- Folder: {metadata.parent_folder_name}")
+            append(f"- Folder: {metadata.parent_folder_name}")
         cls._append_folder_context(sections, metadata)
 
         cls._append_content_excerpt(sections, metadata)
         
-        if metadata.neighbor_names:
-            sections.append("")
-            sections.append("## Other Files in Folder")
-            for name in metadata.neighbor_names[:5]:
-                sections.append(f"- {name}")
+        cls._append_neighbors(sections, metadata, "## Other Files in Folder")
         
-        prompt_line = (
-            "Suggest a clear, descriptive name based on the current filename and context."
-            if metadata.include_current_filename
-            else "Suggest a clear, descriptive name based on the available context."
-        )
-        sections.extend(["", prompt_line])
-        tag_lines = cls._tag_guidance_lines(metadata, "this file")
-        if tag_lines:
-            sections.append("")
-            sections.append("## Tag Guidance")
-            sections.extend(tag_lines)
+        sections.extend(cls._GENERIC_TASK_LINES[metadata.include_current_filename])
+        cls._append_tag_guidance(sections, metadata, "this file")
         
         return "\n".join(sections)
@@ -2,7 +2,8 @@ import httpx
 from pathlib import Path
 import json
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, create_http_client
+from ..json_codec import json_loads, repair_json
 from ..models import LLMConfig, FileMetadata, LLMRenameResponse, ImageMode, PromptOverrides
 from ..media_utils import (
     encode_image_optimized,
@@ -25,16 +26,18 @@ class AnthropicProvider(BaseLLMProvider):
     def __init__(self, config: LLMConfig, prompts: PromptOverrides | None = None):
         super().__init__(config, prompts)
         self.base_url = config.api_base.rstrip("/")
+        # Env vars are read once; toggling debug output requires a new provider
+        self._debug = should_debug("PYNAME_DEBUG_ANTHROPIC") or should_debug("PYNAME_DEBUG")
+        # Model and image mode are fixed per instance; resolve vision handling once
+        self._has_vision = self._model_supports_vision()
+        self._send_images = self._should_send_image(True, self._has_vision)
         headers = {
             "anthropic-version": "2023-06-01",
             "Content-Type": "application/json"
         }
         if config.api_key:
             headers["x-api-key"] = config.api_key
-        self.client = httpx.AsyncClient(
-            timeout=config.timeout_seconds,
-            headers=headers
-        )
+        self.client = create_http_client(config.timeout_seconds, headers)
     
     async def health_check(self) -> bool:
         """Check if Anthropic API is accessible."""
@@ -62,8 +65,8 @@ class AnthropicProvider(BaseLLMProvider):
         # Determine file type and vision capability
         is_image = is_image_file(metadata.extension)
         is_video = is_video_file(metadata.extension)
-        has_vision = self._model_supports_vision()
-        send_image = self._should_send_image(is_image, has_vision)
+        has_vision = self._has_vision
+        send_image = is_image and self._send_images
         
         # Extract video frames if applicable
         video_frames: list[str] = []
@@ -109,18 +112,12 @@ class AnthropicProvider(BaseLLMProvider):
         # Add text prompt
         content.append({"type": "text", "text": prompt})
         
-        response = await self.client.post(
-            f"{self.base_url}/messages",
-            json={
-                "model": self.config.model,
-                "max_tokens": self.config.max_tokens,
-                "system": self.get_system_prompt(metadata),
-                "messages": [{"role": "user", "content": content}]
-            }
-        )
-        self._raise_for_status(response)
-        
-        result = response.json()
+        result = await self._post_json(f"{self.base_url}/messages", {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens,
+            "system": self.get_system_prompt(metadata),
+            "messages": [{"role": "user", "content": content}]
+        })
         if self._should_debug():
             print("Anthropic response payload:", format_response_debug(result))
         
@@ -145,27 +142,23 @@ class AnthropicProvider(BaseLLMProvider):
     
     def _should_debug(self) -> bool:
         """Check if debug logging is enabled."""
-        return should_debug("PYNAME_DEBUG_ANTHROPIC") or should_debug("PYNAME_DEBUG")
+        return self._debug
     
     def _parse_response(self, response_text: str) -> LLMRenameResponse:
         """Parse and validate LLM response."""
         text = response_text.strip()
         
         # Claude sometimes wraps JSON in markdown
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            text = text[start:end].strip()
+        _, fence, rest = text.partition("```")
+        if fence:
+            if rest.startswith("json"):
+                rest = rest[4:]
+            text = rest.partition("```")[0].strip()
         
         try:
-            data = json.loads(text)
+            data = json_loads(text)
         except json.JSONDecodeError:
-            from json_repair import repair_json
-            data = json.loads(repair_json(text))
+            data = json_loads(repair_json(text))
         
         return LLMRenameResponse(**data)
     
@@ -175,7 +168,7 @@ class AnthropicProvider(BaseLLMProvider):
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
-            detail = response.text.strip() or "No response body"
+            detail = BaseLLMProvider._error_detail(response)
             raise ValueError(
                 f"Anthropic API error {response.status_code}: {detail}"
             ) from exc
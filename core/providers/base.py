@@ -1,8 +1,59 @@
+import functools
 from abc import ABC, abstractmethod
 from pathlib import Path
+import httpx
+from ..json_codec import json_dumps, json_loads
 from ..models import LLMConfig, FileMetadata, LLMRenameResponse, PromptOverrides
 from ..prompts import PromptBuilder
 
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Keep connections warm across a bulk run; requests to one host reuse sockets
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=128,
+    keepalive_expiry=60,
+)
+
+
+def create_http_client(timeout: float, headers: dict[str, str] | None = None) -> httpx.AsyncClient:
+    """Create a pooled client, multiplexed over HTTP/2 when h2 is installed."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        headers=headers,
+        limits=_HTTP_LIMITS,
+        http2=_HTTP2_AVAILABLE,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def system_message(prompt: str) -> dict[str, str]:
+    """Chat Completions system message, shared across requests; do not mutate."""
+    return {"role": "system", "content": prompt}
+
+
+# JSON schema for rename responses, used by the OpenAI and OpenRouter
+# structured-output requests
+RENAME_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "suggested_name": {"type": "string"},
+        "reasoning": {"type": "string"},
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        "tags": {
+            "type": "array",
+            "items": {"type": "string"},
+            "maxItems": 10
+        }
+    },
+    "required": ["suggested_name", "reasoning", "confidence", "tags"],
+    "additionalProperties": False
+}
+
 
 class BaseLLMProvider(ABC):
     """Abstract base for LLM providers."""
@@ -10,6 +61,8 @@ class BaseLLMProvider(ABC):
     def __init__(self, config: LLMConfig, prompts: PromptOverrides | None = None):
         self.config = config
         self.prompts = prompts
+        # System prompts depend only on file type and overrides, both fixed per instance
+        self._system_prompt_cache: dict[str, str] = {}
     
     @abstractmethod
     async def get_rename_suggestion(
@@ -31,8 +84,37 @@ class BaseLLMProvider(ABC):
 
     def get_system_prompt(self, metadata: FileMetadata) -> str:
         """Get system prompt for the file type."""
-        return PromptBuilder.get_system_prompt(metadata, self.prompts)
+        prompt_type = PromptBuilder._prompt_type(metadata)
+        prompt = self._system_prompt_cache.get(prompt_type)
+        if prompt is None:
+            prompt = PromptBuilder.get_system_prompt(metadata, self.prompts)
+            self._system_prompt_cache[prompt_type] = prompt
+        return prompt
     
+    async def _post_json(self, url: str, payload: dict):
+        """
+        POST a JSON payload and parse the JSON reply.
+
+        The payload is serialized once to bytes (orjson when installed); the
+        reply is read as it arrives and parsed once when the stream ends.
+        Providers using this must define self.client and _raise_for_status.
+        """
+        content = json_dumps(payload)
+        async with self.client.stream("POST", url, content=content) as response:
+            if not response.is_success:
+                await response.aread()
+                self._raise_for_status(response)
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+        return json_loads(buffer)
+
+    @staticmethod
+    def _error_detail(response: httpx.Response, limit: int = 4096) -> str:
+        """Decode a bounded prefix of an error body, e.g. a proxy's HTML error page."""
+        detail = response.content[:limit].decode("utf-8", "replace").strip()
+        return detail or "No response body"
+
     @property
     def system_prompt(self) -> str:
         return PromptBuilder.SYSTEM_PROMPT_BASE
@@ -1,8 +1,10 @@
 import httpx
 from pathlib import Path
 import json
+import re
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, create_http_client
+from ..json_codec import json_loads, repair_json
 from ..models import LLMConfig, FileMetadata, LLMRenameResponse, ImageMode, PromptOverrides
 from ..media_utils import (
     encode_image_optimized,
@@ -16,6 +18,10 @@ from ..media_utils import (
 )
 
 
+# First flat {...} object in a chatty response
+_JSON_OBJ_RE = re.compile(r'\{[^{}]*\}')
+
+
 class OllamaProvider(BaseLLMProvider):
     """Ollama LLM provider implementation."""
     
@@ -25,7 +31,24 @@ class OllamaProvider(BaseLLMProvider):
     def __init__(self, config: LLMConfig, prompts: PromptOverrides | None = None):
         super().__init__(config, prompts)
         self.base_url = config.api_base.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=config.timeout_seconds)
+        # Env vars are read once; toggling debug output requires a new provider
+        self._debug = should_debug("PYNAME_DEBUG_OLLAMA") or should_debug("PYNAME_DEBUG")
+        # Model and image mode are fixed per instance; resolve vision handling once
+        self._has_vision = self._model_supports_vision()
+        self._send_images = self._should_send_image(True, self._has_vision)
+        # Per-file fields are merged into a shallow copy on each request
+        self._request_template = {
+            "model": config.model,
+            "stream": False,
+            "options": {
+                "temperature": config.temperature,
+                "num_predict": config.max_tokens
+            }
+        }
+        self.client = create_http_client(
+            config.timeout_seconds,
+            {"Content-Type": "application/json"}
+        )
     
     async def health_check(self) -> bool:
         """Check if Ollama is running."""
@@ -46,8 +69,8 @@ class OllamaProvider(BaseLLMProvider):
         # Determine file type and vision capability
         is_image = is_image_file(metadata.extension)
         is_video = is_video_file(metadata.extension)
-        has_vision = self._model_supports_vision()
-        send_image = self._should_send_image(is_image, has_vision)
+        has_vision = self._has_vision
+        send_image = is_image and self._send_images
         
         # Extract video frames if applicable
         video_frames: list[str] = []
@@ -65,14 +88,9 @@ class OllamaProvider(BaseLLMProvider):
             print("Ollama prompt info:", format_prompt_debug(prompt, metadata.content_excerpt))
         
         request_body = {
-            "model": self.config.model,
+            **self._request_template,
             "prompt": prompt,
             "system": self.get_system_prompt(metadata),
-            "stream": False,
-            "options": {
-                "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens
-            }
         }
         
         # Add images if applicable (optimized encoding)
@@ -87,13 +105,7 @@ class OllamaProvider(BaseLLMProvider):
         if images:
             request_body["images"] = images
         
-        response = await self.client.post(
-            f"{self.base_url}/api/generate",
-            json=request_body
-        )
-        self._raise_for_status(response)
-        
-        result = response.json()
+        result = await self._post_json(f"{self.base_url}/api/generate", request_body)
         if self._should_debug():
             print("Ollama response payload:", format_response_debug(result))
         
@@ -118,7 +130,7 @@ class OllamaProvider(BaseLLMProvider):
     
     def _should_debug(self) -> bool:
         """Check if debug logging is enabled."""
-        return should_debug("PYNAME_DEBUG_OLLAMA") or should_debug("PYNAME_DEBUG")
+        return self._debug
     
     def _parse_response(self, response_text: str) -> LLMRenameResponse:
         """Parse and validate LLM response."""
@@ -127,28 +139,27 @@ class OllamaProvider(BaseLLMProvider):
         
         # Remove markdown code blocks if present
         if text.startswith("```"):
-            lines = text.split("\n")
-            # Remove first and last lines if they're code fences
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+            # Drop the opening fence line, and the last line if it closes the fence
+            text = text.partition("\n")[2]
+            body, _, last = text.rpartition("\n")
+            if last.strip() == "```":
+                text = body
         
         # Try to parse JSON
         try:
-            data = json.loads(text)
+            data = json_loads(text)
         except json.JSONDecodeError:
+            # A bare {...} object has no wrapping prose to cut away; repair it directly
+            if text.startswith("{") and text.endswith("}"):
+                return LLMRenameResponse(**json_loads(repair_json(text)))
             # Try to extract JSON from the response
-            import re
-            json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
+            json_match = _JSON_OBJ_RE.search(text)
             if json_match:
                 try:
-                    data = json.loads(json_match.group())
+                    data = json_loads(json_match.group())
                 except json.JSONDecodeError:
                     # Use json_repair as last resort
-                    from json_repair import repair_json
-                    data = json.loads(repair_json(text))
+                    data = json_loads(repair_json(text))
             else:
                 raise ValueError(f"Could not parse LLM response as JSON: {text[:200]}")
         
@@ -160,7 +171,7 @@ class OllamaProvider(BaseLLMProvider):
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
-            detail = response.text.strip() or "No response body"
+            detail = BaseLLMProvider._error_detail(response)
             raise ValueError(
                 f"Ollama API error {response.status_code}: {detail}"
             ) from exc
@@ -1,11 +1,13 @@
 import httpx
+from enum import IntFlag
 from pathlib import Path
 import json
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, RENAME_RESPONSE_SCHEMA, create_http_client, system_message
+from ..json_codec import json_dumps, json_loads, repair_json
 from ..models import LLMConfig, FileMetadata, LLMRenameResponse, LLMProvider, ImageMode, PromptOverrides
 from ..media_utils import (
-    encode_image_optimized,
+    encode_image_data_url,
     extract_video_frames,
     model_supports_vision,
     is_image_file,
@@ -15,6 +17,38 @@ from ..media_utils import (
 )
 
 
+# Responses API format for rename responses. Shared by every request; a plain
+# dict because orjson cannot serialize MappingProxyType. Treat as read-only.
+_RENAME_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "name": "rename_response",
+    "strict": True,
+    "schema": RENAME_RESPONSE_SCHEMA
+}
+
+
+class ModelFlags(IntFlag):
+    """Capabilities derived from the configured model name."""
+    IS_GPT5 = 1
+    HAS_VISION = 2
+    USE_RESPONSES_API = 4
+
+
+def _classify_model(model: str, provider: LLMProvider, known_vision: set[str]) -> ModelFlags:
+    model_lower = model.lower()
+    flags = ModelFlags(0)
+    if model_lower.startswith("gpt-5"):
+        flags |= ModelFlags.IS_GPT5
+        # Use the Responses API for GPT-5 models
+        if provider == LLMProvider.OPENAI:
+            flags |= ModelFlags.USE_RESPONSES_API
+    # Check OpenAI-specific GPT-5 models first, then shared detection
+    # for other models (LM Studio, compatible APIs)
+    if any(v in model_lower for v in known_vision) or model_supports_vision(model):
+        flags |= ModelFlags.HAS_VISION
+    return flags
+
+
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider implementation."""
     
@@ -24,15 +58,22 @@ class OpenAIProvider(BaseLLMProvider):
     def __init__(self, config: LLMConfig, prompts: PromptOverrides | None = None):
         super().__init__(config, prompts)
         self.base_url = config.api_base.rstrip("/")
+        # Env vars are read once; toggling debug output requires a new provider
+        debug_env = (
+            "PYNAME_DEBUG_LMSTUDIO"
+            if config.provider == LLMProvider.LMSTUDIO
+            else "PYNAME_DEBUG_OPENAI"
+        )
+        self._debug = should_debug(debug_env) or should_debug("PYNAME_DEBUG")
+        # Model and provider are fixed per instance; classify the model once
+        self._flags = _classify_model(config.model, config.provider, self.KNOWN_VISION_MODELS)
+        self._send_images = self._should_send_image(True, self._model_supports_vision())
         headers = {
             "Content-Type": "application/json"
         }
         if config.api_key:
             headers["Authorization"] = f"Bearer {config.api_key}"
-        self.client = httpx.AsyncClient(
-            timeout=config.timeout_seconds,
-            headers=headers
-        )
+        self.client = create_http_client(config.timeout_seconds, headers)
     
     async def health_check(self) -> bool:
         """Check if OpenAI API is accessible."""
@@ -55,8 +96,9 @@ class OpenAIProvider(BaseLLMProvider):
         # Determine file type and vision capability
         is_image = is_image_file(metadata.extension)
         is_video = is_video_file(metadata.extension)
-        has_vision = self._model_supports_vision()
-        send_image = self._should_send_image(is_image, has_vision)
+        flags = self._flags
+        has_vision = bool(flags & ModelFlags.HAS_VISION)
+        send_image = is_image and self._send_images
         
         # Extract video frames if applicable (OpenAI and LM Studio both support vision)
         video_frames: list[str] = []
@@ -70,7 +112,8 @@ class OpenAIProvider(BaseLLMProvider):
             video_frames = await extract_video_frames(
                 file_path,
                 metadata.video_extract_count or 0,
-                duration
+                duration,
+                as_data_url=True
             )
             if self._should_debug():
                 provider_name = "LMStudio" if self.config.provider == LLMProvider.LMSTUDIO else "OpenAI"
@@ -79,19 +122,15 @@ class OpenAIProvider(BaseLLMProvider):
         if self._should_debug():
             print("OpenAI prompt info:", self._format_prompt_debug(metadata, prompt))
 
-        if self._use_responses_api():
-            input_content = [{"type": "input_text", "text": prompt}]
-            if send_image:
-                image_data, media_type = await encode_image_optimized(file_path)
-                input_content.append({
-                    "type": "input_image",
-                    "image_url": f"data:{media_type};base64,{image_data}"
-                })
-            for frame in video_frames:
-                input_content.append({
-                    "type": "input_image",
-                    "image_url": f"data:image/jpeg;base64,{frame}"
-                })
+        image_urls = video_frames
+        if send_image:
+            image_urls = [await encode_image_data_url(file_path), *video_frames]
+
+        if flags & ModelFlags.USE_RESPONSES_API:
+            input_content = [
+                {"type": "input_text", "text": prompt},
+                *[{"type": "input_image", "image_url": url} for url in image_urls]
+            ]
 
             payload = {
                 "model": self.config.model,
@@ -100,20 +139,15 @@ class OpenAIProvider(BaseLLMProvider):
                 "max_output_tokens": self._gpt5_max_output_tokens(),
                 "reasoning": {"effort": "medium"}
             }
-            if self._supports_temperature():
+            if not flags & ModelFlags.IS_GPT5:
                 payload["temperature"] = self.config.temperature
             if self.config.provider != LLMProvider.LMSTUDIO:
                 payload["text"] = {
-                    "format": self._rename_response_format(),
+                    "format": _RENAME_RESPONSE_FORMAT,
                     "verbosity": "low"
                 }
 
-            response = await self.client.post(
-                f"{self.base_url}/responses",
-                json=payload
-            )
-            self._raise_for_status(response)
-            result = response.json()
+            result = await self._post_json(f"{self.base_url}/responses", payload)
             if self._should_debug():
                 print("OpenAI response payload:", format_response_debug(result))
             try:
@@ -125,49 +159,32 @@ class OpenAIProvider(BaseLLMProvider):
                 ) from exc
         else:
             # Build messages for Chat Completions
+            if image_urls:
+                user_content = [
+                    {"type": "text", "text": prompt},
+                    *[
+                        {"type": "image_url", "image_url": {"url": url, "detail": "low"}}
+                        for url in image_urls
+                    ]
+                ]
+            else:
+                user_content = prompt
             messages = [
-                {"role": "system", "content": self.get_system_prompt(metadata)}
+                system_message(self.get_system_prompt(metadata)),
+                {"role": "user", "content": user_content}
             ]
-            if send_image or video_frames:
-                content_blocks = [{"type": "text", "text": prompt}]
-                if send_image:
-                    image_data, media_type = await encode_image_optimized(file_path)
-                    content_blocks.append({
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{media_type};base64,{image_data}",
-                            "detail": "low"
-                        }
-                    })
-                for frame in video_frames:
-                    content_blocks.append({
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/jpeg;base64,{frame}",
-                            "detail": "low"
-                        }
-                    })
-                messages.append({"role": "user", "content": content_blocks})
-            else:
-                messages.append({"role": "user", "content": prompt})
 
             payload = {
                 "model": self.config.model,
                 "messages": messages,
                 "max_tokens": self.config.max_tokens
             }
-            if self._supports_temperature():
+            if not flags & ModelFlags.IS_GPT5:
                 payload["temperature"] = self.config.temperature
             if self.config.provider != LLMProvider.LMSTUDIO:
                 payload["response_format"] = {"type": "json_object"}
 
-            response = await self.client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload
-            )
-            self._raise_for_status(response)
-            
-            result = response.json()
+            result = await self._post_json(f"{self.base_url}/chat/completions", payload)
             if self._should_debug():
                 print("OpenAI response payload:", format_response_debug(result))
             try:
@@ -182,12 +199,7 @@ class OpenAIProvider(BaseLLMProvider):
 
     def _model_supports_vision(self) -> bool:
         """Infer vision capability from model name using shared detection."""
-        model = self.config.model.lower()
-        # Check OpenAI-specific GPT-5 models first
-        if any(v in model for v in self.KNOWN_VISION_MODELS):
-            return True
-        # Use shared detection for other models (LM Studio, compatible APIs)
-        return model_supports_vision(self.config.model)
+        return bool(self._flags & ModelFlags.HAS_VISION)
 
     def _should_send_image(self, is_image: bool, has_vision: bool) -> bool:
         """Determine if we should send image data."""
@@ -199,17 +211,6 @@ class OpenAIProvider(BaseLLMProvider):
             return True
         return has_vision
 
-    def _use_responses_api(self) -> bool:
-        """Use the Responses API for GPT-5 models."""
-        return (
-            self.config.provider == LLMProvider.OPENAI
-            and self.config.model.lower().startswith("gpt-5")
-        )
-
-    def _supports_temperature(self) -> bool:
-        """Check if the current model accepts temperature."""
-        return not self.config.model.lower().startswith("gpt-5")
-
     def _gpt5_max_output_tokens(self) -> int:
         """Ensure GPT-5 has enough output tokens for reasoning + response."""
         # GPT-5 reasoning consumes output tokens internally before producing response
@@ -219,43 +220,49 @@ class OpenAIProvider(BaseLLMProvider):
     
     def _should_debug(self) -> bool:
         """Check if debug logging is enabled."""
-        if self.config.provider == LLMProvider.LMSTUDIO:
-            return should_debug("PYNAME_DEBUG_LMSTUDIO") or should_debug("PYNAME_DEBUG")
-        return should_debug("PYNAME_DEBUG_OPENAI") or should_debug("PYNAME_DEBUG")
+        return self._debug
     
     def _parse_response(self, response_text: str) -> LLMRenameResponse:
         """Parse and validate LLM response."""
         try:
-            data = json.loads(response_text)
+            data = json_loads(response_text)
         except json.JSONDecodeError:
-            from json_repair import repair_json
-            data = json.loads(repair_json(response_text))
+            data = json_loads(repair_json(response_text))
         
         return LLMRenameResponse(**data)
 
+    # Lookup order for text-bearing keys at each level of a Responses API
+    # payload; True marks keys normalized as text rather than JSON
+    _RESULT_KEYS = (("output_text", True), ("output_json", False), ("output_parsed", False))
+    _ITEM_KEYS = (("output_json", False), ("output_parsed", False), ("text", True), ("json", False))
+    _BLOCK_KEYS = (("output_json", False), ("output_parsed", False), ("json", False), ("text", True))
+
+    @classmethod
+    def _first_value(cls, data: dict, keys: tuple[tuple[str, bool], ...]) -> str | None:
+        for key, is_text in keys:
+            value = data.get(key)
+            if value is None:
+                continue
+            normalized = cls._normalize_text(value) if is_text else cls._normalize_json(value)
+            if normalized:
+                return normalized
+        return None
+
     @classmethod
     def _extract_response_text(cls, result: dict) -> str:
         """Extract text from the Responses API payload."""
-        output_text = cls._normalize_text(result.get("output_text"))
-        if output_text:
-            return output_text
-        output_json = cls._normalize_json(result.get("output_json"))
-        if output_json:
-            return output_json
-        output_parsed = cls._normalize_json(result.get("output_parsed"))
-        if output_parsed:
-            return output_parsed
+        text = cls._first_value(result, cls._RESULT_KEYS)
+        if text:
+            return text
 
         output = result.get("output", [])
+        if isinstance(output, dict):
+            output = [output]
         if isinstance(output, list):
             for item in output:
                 text = cls._scan_output_item(item)
                 if text:
                     return text
-        elif isinstance(output, dict):
-            text = cls._scan_output_item(output)
-            if text:
-                return text
         error = result.get("error")
         if error:
             raise ValueError(f"OpenAI response error: {error}")
@@ -270,19 +277,9 @@ class OpenAIProvider(BaseLLMProvider):
         if not isinstance(item, dict):
             return None
 
-        output_json = cls._normalize_json(item.get("output_json"))
-        if output_json:
-            return output_json
-        output_parsed = cls._normalize_json(item.get("output_parsed"))
-        if output_parsed:
-            return output_parsed
-
-        text = cls._normalize_text(item.get("text"))
+        text = cls._first_value(item, cls._ITEM_KEYS)
         if text:
             return text
-        json_payload = cls._normalize_json(item.get("json"))
-        if json_payload:
-            return json_payload
 
         content = item.get("content")
         if isinstance(content, list):
@@ -293,31 +290,14 @@ class OpenAIProvider(BaseLLMProvider):
                     refusal = cls._normalize_text(block.get("refusal") or block.get("text"))
                     if refusal:
                         raise ValueError(f"OpenAI response refusal: {refusal}")
-                output_json = cls._normalize_json(block.get("output_json"))
-                if output_json:
-                    return output_json
-                output_parsed = cls._normalize_json(block.get("output_parsed"))
-                if output_parsed:
-                    return output_parsed
-                json_payload = cls._normalize_json(block.get("json"))
-                if json_payload:
-                    return json_payload
-                text = cls._normalize_text(block.get("text"))
+                text = cls._first_value(block, cls._BLOCK_KEYS)
                 if text:
                     return text
         if isinstance(content, dict):
-            output_json = cls._normalize_json(content.get("output_json"))
-            if output_json:
-                return output_json
-            output_parsed = cls._normalize_json(content.get("output_parsed"))
-            if output_parsed:
-                return output_parsed
-            json_payload = cls._normalize_json(content.get("json"))
-            if json_payload:
-                return json_payload
-            text = cls._normalize_text(content.get("text") or content.get("output_text"))
+            text = cls._first_value(content, cls._BLOCK_KEYS[:3])
             if text:
                 return text
+            return cls._normalize_text(content.get("text") or content.get("output_text"))
         return None
 
     @staticmethod
@@ -337,7 +317,7 @@ class OpenAIProvider(BaseLLMProvider):
     @staticmethod
     def _normalize_json(value: object) -> str | None:
         if isinstance(value, (dict, list)) and value:
-            return json.dumps(value)
+            return json_dumps(value).decode()
         if isinstance(value, str):
             stripped = value.strip()
             return stripped if stripped else None
@@ -365,31 +345,7 @@ class OpenAIProvider(BaseLLMProvider):
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
-            detail = response.text.strip() or "No response body"
+            detail = BaseLLMProvider._error_detail(response)
             raise ValueError(
                 f"OpenAI API error {response.status_code}: {detail}"
             ) from exc
-
-    @staticmethod
-    def _rename_response_format() -> dict:
-        """JSON schema format for rename responses."""
-        return {
-            "type": "json_schema",
-            "name": "rename_response",
-            "strict": True,
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "suggested_name": {"type": "string"},
-                    "reasoning": {"type": "string"},
-                    "confidence": {"type": "number", "minimum": 0, "maximum": 1},
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "maxItems": 10
-                    }
-                },
-                "required": ["suggested_name", "reasoning", "confidence", "tags"],
-                "additionalProperties": False
-            }
-        }
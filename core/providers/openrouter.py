@@ -2,10 +2,11 @@ import httpx
 from pathlib import Path
 import json
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, RENAME_RESPONSE_SCHEMA, create_http_client, system_message
+from ..json_codec import json_loads, repair_json
 from ..models import LLMConfig, FileMetadata, LLMRenameResponse, PromptOverrides
 from ..media_utils import (
-    encode_image_optimized,
+    encode_image_data_url,
     extract_video_frames,
     is_image_file,
     is_video_file,
@@ -15,12 +16,43 @@ from ..media_utils import (
 )
 
 
+# Model id prefixes that honor json_schema response formats on OpenRouter
+STRUCTURED_OUTPUT_PREFIXES = (
+    "openai/gpt-4o",
+    "openai/gpt-4.1",
+    "openai/gpt-5",
+    "openai/o3",
+    "openai/o4",
+    "google/gemini",
+)
+
+# Chat Completions response formats; read-only, shared by every request
+_SCHEMA_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "rename_response",
+        "strict": True,
+        "schema": RENAME_RESPONSE_SCHEMA
+    }
+}
+_JSON_OBJECT_RESPONSE_FORMAT = {"type": "json_object"}
+
+
 class OpenRouterProvider(BaseLLMProvider):
     """OpenRouter API provider implementation (OpenAI-compatible)."""
     
     def __init__(self, config: LLMConfig, prompts: PromptOverrides | None = None):
         super().__init__(config, prompts)
         self.base_url = config.api_base.rstrip("/")
+        # Env vars are read once; toggling debug output requires a new provider
+        self._debug = should_debug("PYNAME_DEBUG_OPENROUTER") or should_debug("PYNAME_DEBUG")
+        # Models with structured output return bare JSON, keeping fence stripping
+        # and json_repair off the happy path
+        self._response_format = (
+            _SCHEMA_RESPONSE_FORMAT
+            if config.model.lower().startswith(STRUCTURED_OUTPUT_PREFIXES)
+            else _JSON_OBJECT_RESPONSE_FORMAT
+        )
         headers = {
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/juangrukat/pyname",
@@ -28,10 +60,7 @@ class OpenRouterProvider(BaseLLMProvider):
         }
         if config.api_key:
             headers["Authorization"] = f"Bearer {config.api_key}"
-        self.client = httpx.AsyncClient(
-            timeout=config.timeout_seconds,
-            headers=headers
-        )
+        self.client = create_http_client(config.timeout_seconds, headers)
     
     async def health_check(self) -> bool:
         """Check if OpenRouter API is accessible."""
@@ -64,7 +93,8 @@ class OpenRouterProvider(BaseLLMProvider):
             video_frames = await extract_video_frames(
                 file_path,
                 metadata.video_extract_count or 0,
-                duration
+                duration,
+                as_data_url=True
             )
             if self._should_debug():
                 print(f"OpenRouter video frames extracted: {len(video_frames)}")
@@ -73,51 +103,34 @@ class OpenRouterProvider(BaseLLMProvider):
             print("OpenRouter prompt info:", format_prompt_debug(prompt, metadata.content_excerpt))
         
         # Build messages for Chat Completions (OpenAI-compatible format)
-        messages = [
-            {"role": "system", "content": self.get_system_prompt(metadata)}
-        ]
+        image_urls = video_frames
+        if send_image:
+            image_urls = [await encode_image_data_url(file_path), *video_frames]
         
-        if send_image or video_frames:
+        if image_urls:
             # Multimodal content with images
-            content_blocks = [{"type": "text", "text": prompt}]
-            
-            if send_image:
-                image_data, media_type = await encode_image_optimized(file_path)
-                content_blocks.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:{media_type};base64,{image_data}"
-                    }
-                })
-            
-            for frame in video_frames:
-                content_blocks.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{frame}"
-                    }
-                })
-            
-            messages.append({"role": "user", "content": content_blocks})
+            user_content = [
+                {"type": "text", "text": prompt},
+                *[{"type": "image_url", "image_url": {"url": url}} for url in image_urls]
+            ]
         else:
             # Text-only content
-            messages.append({"role": "user", "content": prompt})
+            user_content = prompt
+        
+        messages = [
+            system_message(self.get_system_prompt(metadata)),
+            {"role": "user", "content": user_content}
+        ]
         
         payload = {
             "model": self.config.model,
             "messages": messages,
             "max_tokens": self.config.max_tokens,
             "temperature": self.config.temperature,
-            "response_format": {"type": "json_object"}
+            "response_format": self._response_format
         }
         
-        response = await self.client.post(
-            f"{self.base_url}/chat/completions",
-            json=payload
-        )
-        self._raise_for_status(response)
-        
-        result = response.json()
+        result = await self._post_json(f"{self.base_url}/chat/completions", payload)
         if self._should_debug():
             print("OpenRouter response payload:", format_response_debug(result))
         
@@ -151,7 +164,7 @@ class OpenRouterProvider(BaseLLMProvider):
     
     def _should_debug(self) -> bool:
         """Check if debug logging is enabled."""
-        return should_debug("PYNAME_DEBUG_OPENROUTER") or should_debug("PYNAME_DEBUG")
+        return self._debug
     
     def _parse_response(self, response_text: str) -> LLMRenameResponse:
         """Parse and validate LLM response."""
@@ -168,10 +181,9 @@ class OpenRouterProvider(BaseLLMProvider):
             text = text[start:end].strip()
         
         try:
-            data = json.loads(text)
+            data = json_loads(text)
         except json.JSONDecodeError:
-            from json_repair import repair_json
-            data = json.loads(repair_json(text))
+            data = json_loads(repair_json(text))
         
         return LLMRenameResponse(**data)
     
@@ -181,7 +193,7 @@ class OpenRouterProvider(BaseLLMProvider):
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
-            detail = response.text.strip() or "No response body"
+            detail = BaseLLMProvider._error_detail(response)
             raise ValueError(
                 f"OpenRouter API error {response.status_code}: {detail}"
             ) from exc
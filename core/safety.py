@@ -1,3 +1,4 @@
+import os
 import re
 import unicodedata
 from pathlib import Path
@@ -9,6 +10,12 @@ ILLEGAL_CHARS = re.compile(r'[:\x00/]')
 # Additional characters to sanitize for safety
 UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 
+# Translation table equivalent to UNSAFE_CHARS.sub("_", ...), applied in one C pass
+UNSAFE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*' + "".join(map(chr, range(32))), "_"))
+
+# Runs of underscores/hyphens, collapsed to a single hyphen
+COLLAPSE_RUNS = re.compile(r'[-_]{2,}')
+
 # Maximum filename length (macOS HFS+ limit is 255 UTF-16 code units)
 MAX_FILENAME_LENGTH = 200
 
@@ -34,17 +41,18 @@ class SafetyChecker:
         name = unicodedata.normalize("NFC", name)
         
         # Remove/replace unsafe characters
-        name = UNSAFE_CHARS.sub("_", name)
-        
-        # Remove leading/trailing dots and spaces (problematic on macOS)
-        name = name.strip(". ")
+        name = name.translate(UNSAFE_TABLE)
         
         # Collapse multiple underscores/hyphens
-        name = re.sub(r'[-_]{2,}', '-', name)
+        name = COLLAPSE_RUNS.sub('-', name)
         
         # Truncate if necessary
         if len(name) > max_length:
-            name = name[:max_length].rstrip("-_. ")
+            name = name[:max_length]
+        
+        # Remove leading/trailing dots and spaces (problematic on macOS) along
+        # with separators left dangling by replacement or truncation
+        name = name.strip("-_. ")
         
         # Final check
         if not name:
@@ -69,12 +77,22 @@ class SafetyChecker:
         stem = target_path.stem
         suffix = target_path.suffix
         
+        # One directory listing instead of a stat per probe. Names are compared
+        # casefolded (macOS volumes are case-insensitive by default) and the
+        # chosen candidate is still confirmed with exists().
+        try:
+            with os.scandir(parent) as entries:
+                taken = {entry.name.casefold() for entry in entries}
+        except OSError:
+            taken = None
+        
         counter = 1
         while True:
             new_name = f"{stem}_v{counter}{suffix}"
             new_path = parent / new_name
             
-            if not new_path.exists():
+            listed = taken is not None and new_name.casefold() in taken
+            if not listed and not new_path.exists():
                 return new_path
             
             counter += 1
@@ -109,12 +127,21 @@ class SafetyChecker:
         if not target.parent.exists():
             return False, f"Target directory does not exist: {target.parent}"
         
-        # Source and target must be different
-        if source.resolve() == target.resolve():
-            return False, "Source and target are the same file"
-        
-        # Check filename length
-        if len(target.name.encode('utf-8')) > 255:
-            return False, f"Filename too long: {target.name}"
+        # Source and target must be different. Only same-named paths are
+        # compared: a case-only rename hits the same inode on case-insensitive
+        # volumes but is still a real rename.
+        if source.name == target.name:
+            try:
+                same = source.samefile(target)
+            except OSError:
+                same = False
+            if same:
+                return False, "Source and target are the same file"
+        
+        # Check filename length (ASCII names are one byte per char, no encode needed)
+        name = target.name
+        byte_length = len(name) if name.isascii() else len(name.encode('utf-8'))
+        if byte_length > 255:
+            return False, f"Filename too long: {name}"
         
         return True, ""
\ No newline at end of file
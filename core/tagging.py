@@ -1,15 +1,18 @@
 import asyncio
 import logging
+import os
 import shutil
-import subprocess
+from collections import defaultdict
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Paths per bulk `tag` invocation, well below ARG_MAX
+TAG_BATCH_SIZE = 500
+
 
 def _should_debug() -> bool:
     """Check if debug logging is enabled via environment."""
-    import os
     return os.environ.get("PYNAME_DEBUG_TAGS", "").lower() in ("1", "true", "yes") or \
            os.environ.get("PYNAME_DEBUG", "").lower() in ("1", "true", "yes")
 
@@ -19,12 +22,19 @@ class TagManager:
     
     def __init__(self):
         self._tag_available: bool | None = None
+        # Absolute path to `tag`, resolved once so each exec skips the PATH search
+        self._tag_path: str = "tag"
         self._warned_unavailable: bool = False
+        # Env vars are read once; toggling debug output requires a new manager
+        self._debug: bool = _should_debug()
     
     async def is_available(self) -> bool:
         """Check if the tag CLI tool is available."""
         if self._tag_available is None:
-            self._tag_available = shutil.which("tag") is not None
+            tag_path = shutil.which("tag")
+            self._tag_available = tag_path is not None
+            if tag_path:
+                self._tag_path = tag_path
             if not self._tag_available and not self._warned_unavailable:
                 self._warned_unavailable = True
                 logger.warning(
@@ -44,6 +54,10 @@ class TagManager:
         Returns:
             True if successful, False otherwise
         """
+        return await self._add_tags(str(file_path), tags)
+
+    async def _add_tags(self, path_str: str, tags: list[str]) -> bool:
+        """add_tags() for a path already converted to str."""
         if not await self.is_available():
             return False
         
@@ -54,46 +68,124 @@ class TagManager:
         clean_tags = [tag.replace(",", " ") for tag in tags]
         tag_string = ",".join(clean_tags)
         
-        if _should_debug():
-            logger.info(f"Adding tags to {file_path.name}: {clean_tags}")
+        if self._debug:
+            logger.info(f"Adding tags to {os.path.basename(path_str)}: {clean_tags}")
         
-        def _run():
-            try:
-                result = subprocess.run(
-                    ["tag", "--add", tag_string, str(file_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if result.returncode != 0:
-                    stderr = result.stderr.strip()
-                    logger.warning(f"Failed to add tags to {file_path.name}: {stderr or 'unknown error'}")
-                    return False
-                if _should_debug():
-                    logger.info(f"Successfully added tags to {file_path.name}")
-                return True
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout adding tags to {file_path.name}")
-                return False
-            except FileNotFoundError:
-                logger.warning("'tag' command not found during execution")
-                return False
-            except Exception as e:
-                logger.warning(f"Error adding tags to {file_path.name}: {e}")
+        return await self._add(tag_string, [path_str])
+
+    async def _run_tag(self, args: list[str], timeout: float = 10) -> tuple[int, str, str]:
+        """
+        Run `tag` and wait on it from the event loop, without a worker thread.
+        
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            self._tag_path,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return (
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+
+    async def _add(self, tag_string: str, paths: list[str]) -> bool:
+        """Run one `tag --add` over one or more file path strings."""
+        label = os.path.basename(paths[0]) if len(paths) == 1 else f"{len(paths)} files"
+        try:
+            returncode, _, stderr = await self._run_tag(
+                ["--add", tag_string, *paths],
+                timeout=10 + len(paths) // 10
+            )
+            if returncode != 0:
+                stderr = stderr.strip()
+                logger.warning(f"Failed to add tags to {label}: {stderr or 'unknown error'}")
                 return False
+            if self._debug:
+                logger.info(f"Successfully added tags to {label}")
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout adding tags to {label}")
+            return False
+        except FileNotFoundError:
+            logger.warning("'tag' command not found during execution")
+            return False
+        except Exception as e:
+            logger.warning(f"Error adding tags to {label}: {e}")
+            return False
+
+    async def apply_tags_bulk(
+        self,
+        items: list[tuple[Path, list[str]]],
+        mode: str = "append"
+    ) -> dict[Path, bool]:
+        """
+        Apply tags to many files with one `tag --add` per distinct tag set.
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run)
+        Replace mode still clears existing tags file by file, since each
+        file's current tags differ.
+        
+        Returns:
+            Mapping of file path to success
+        """
+        if not items:
+            return {}
+        if not await self.is_available():
+            return {file_path: False for file_path, _ in items}
+        
+        results: dict[Path, bool] = {}
+        groups: dict[str, list[tuple[Path, str]]] = defaultdict(list)
+        for file_path, tags in items:
+            path_str = str(file_path)
+            if mode == "replace" and not await self._clear_tags(path_str):
+                results[file_path] = False
+                continue
+            if not tags:
+                results[file_path] = True
+                continue
+            # Tag order is irrelevant to Finder, so sort to merge more groups
+            tag_string = ",".join(sorted(tag.replace(",", " ") for tag in tags))
+            groups[tag_string].append((file_path, path_str))
+        
+        for tag_string, entries in groups.items():
+            for start in range(0, len(entries), TAG_BATCH_SIZE):
+                chunk = entries[start:start + TAG_BATCH_SIZE]
+                if await self._add(tag_string, [path_str for _, path_str in chunk]):
+                    results.update((file_path, True) for file_path, _ in chunk)
+                elif len(chunk) > 1:
+                    # One bad file fails the whole call; retry individually
+                    for file_path, path_str in chunk:
+                        results[file_path] = await self._add(tag_string, [path_str])
+                else:
+                    results[chunk[0][0]] = False
+        return results
 
     async def apply_tags(self, file_path: Path, tags: list[str], mode: str = "append") -> bool:
         """Apply tags using append or replace mode."""
+        # Converted once; replace mode issues up to three `tag` calls
+        path_str = str(file_path)
         if mode == "replace":
-            existing = await self.get_tags(file_path)
-            if existing:
-                removed = await self.remove_tags(file_path, existing)
-                if not removed:
-                    return False
-        return await self.add_tags(file_path, tags)
+            if not await self.is_available():
+                return False
+            if not await self._clear_tags(path_str):
+                return False
+        return await self._add_tags(path_str, tags)
+
+    async def _clear_tags(self, path_str: str) -> bool:
+        """Remove all current tags from a file (replace mode)."""
+        existing = await self._list_tags(path_str)
+        if not existing:
+            return True
+        return await self._remove_tags(path_str, ",".join(existing))
     
     async def get_tags(self, file_path: Path) -> list[str]:
         """
@@ -108,22 +200,17 @@ class TagManager:
         if not await self.is_available():
             return []
         
-        def _run():
-            try:
-                result = subprocess.run(
-                    ["tag", "--list", "--no-name", str(file_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    return [t.strip() for t in result.stdout.split(",") if t.strip()]
-                return []
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                return []
-        
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run)
+        return await self._list_tags(str(file_path))
+
+    async def _list_tags(self, path_str: str) -> list[str]:
+        """Run `tag --list` for a path already converted to str."""
+        try:
+            returncode, stdout, _ = await self._run_tag(["--list", "--no-name", path_str])
+        except (asyncio.TimeoutError, OSError):
+            return []
+        if returncode == 0:
+            return [t.strip() for t in stdout.split(",") if t.strip()]
+        return []
     
     async def remove_tags(self, file_path: Path, tags: list[str]) -> bool:
         """Remove specific tags from a file."""
@@ -133,19 +220,12 @@ class TagManager:
         if not tags:
             return True
         
-        tag_string = ",".join(tags)
-        
-        def _run():
-            try:
-                result = subprocess.run(
-                    ["tag", "--remove", tag_string, str(file_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                return result.returncode == 0
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                return False
-        
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run)
+        return await self._remove_tags(str(file_path), ",".join(tags))
+
+    async def _remove_tags(self, path_str: str, tag_string: str) -> bool:
+        """Run `tag --remove` for a path already converted to str."""
+        try:
+            returncode, _, _ = await self._run_tag(["--remove", tag_string, path_str])
+        except (asyncio.TimeoutError, OSError):
+            return False
+        return returncode == 0
@@ -2,9 +2,36 @@ import re
 from .models import CaseStyle
 
 
+# Word boundaries in one pass: separators, plus the zero-width gaps at
+# camelCase humps and letter/digit transitions
+WORD_BOUNDARY = re.compile(
+    r'[-_./\\]'
+    r'|(?<=[a-z])(?=[A-Z])'
+    r'|(?<=[a-zA-Z])(?=\d)'
+    r'|(?<=\d)(?=[a-zA-Z])'
+)
+
+
 class NameTransformer:
     """Transform names into different case styles."""
     
+    def __init__(self):
+        # Style dispatch table, bound once rather than rebuilt per name
+        self._transformers = {
+            CaseStyle.CAMEL: self._to_camel_case,
+            CaseStyle.CAPITAL: self._to_capital_case,
+            CaseStyle.CONSTANT: self._to_constant_case,
+            CaseStyle.DOT: self._to_dot_case,
+            CaseStyle.KEBAB: self._to_kebab_case,
+            CaseStyle.NO: self._to_no_case,
+            CaseStyle.PASCAL: self._to_pascal_case,
+            CaseStyle.PASCAL_SNAKE: self._to_pascal_snake_case,
+            CaseStyle.PATH: self._to_path_case,
+            CaseStyle.SENTENCE: self._to_sentence_case,
+            CaseStyle.SNAKE: self._to_snake_case,
+            CaseStyle.TRAIN: self._to_train_case,
+        }
+    
     def transform(self, name: str, style: CaseStyle) -> str:
         """
         Transform a name into the specified case style.
@@ -23,22 +50,7 @@ class NameTransformer:
             return name
         
         # Apply the transformation
-        transformers = {
-            CaseStyle.CAMEL: self._to_camel_case,
-            CaseStyle.CAPITAL: self._to_capital_case,
-            CaseStyle.CONSTANT: self._to_constant_case,
-            CaseStyle.DOT: self._to_dot_case,
-            CaseStyle.KEBAB: self._to_kebab_case,
-            CaseStyle.NO: self._to_no_case,
-            CaseStyle.PASCAL: self._to_pascal_case,
-            CaseStyle.PASCAL_SNAKE: self._to_pascal_snake_case,
-            CaseStyle.PATH: self._to_path_case,
-            CaseStyle.SENTENCE: self._to_sentence_case,
-            CaseStyle.SNAKE: self._to_snake_case,
-            CaseStyle.TRAIN: self._to_train_case,
-        }
-        
-        transformer = transformers.get(style, self._to_kebab_case)
+        transformer = self._transformers.get(style, self._to_kebab_case)
         return transformer(words)
     
     def _split_into_words(self, name: str) -> list[str]:
@@ -52,20 +64,12 @@ class NameTransformer:
         - dot.case -> ["dot", "case"]
         - Mixed formats
         """
-        # Replace common separators with spaces
-        s = re.sub(r'[-_./\\]', ' ', name)
-        
-        # Insert space before uppercase letters (for camelCase)
-        s = re.sub(r'([a-z])([A-Z])', r'\1 \2', s)
-        
-        # Insert space between letters and numbers
-        s = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', s)
-        s = re.sub(r'(\d)([a-zA-Z])', r'\1 \2', s)
-        
-        # Split and filter
-        words = [w.strip() for w in s.split() if w.strip()]
+        # Replace separators with spaces and split camelCase humps and
+        # letter/digit transitions, all in a single scan
+        s = WORD_BOUNDARY.sub(' ', name)
         
-        return words
+        # str.split() drops empty and whitespace-only pieces on its own
+        return s.split()
     
     # ─────────────────────────────────────────────────────────────────────────
     # Transformation Methods
@@ -75,56 +79,52 @@ class NameTransformer:
         """camelCase: first word lowercase, rest capitalized."""
         if not words:
             return ""
-        result = words[0].lower()
-        for word in words[1:]:
-            result += word.capitalize()
-        return result
+        return words[0].lower() + "".join(map(str.capitalize, words[1:]))
     
     def _to_capital_case(self, words: list[str]) -> str:
         """Capital Case: each word capitalized, space separated."""
-        return " ".join(word.capitalize() for word in words)
+        return " ".join(map(str.capitalize, words))
     
     def _to_constant_case(self, words: list[str]) -> str:
         """CONSTANT_CASE: all uppercase, underscore separated."""
-        return "_".join(word.upper() for word in words)
+        return "_".join(words).upper()
     
     def _to_dot_case(self, words: list[str]) -> str:
         """dot.case: all lowercase, dot separated."""
-        return ".".join(word.lower() for word in words)
+        # Per word: "." is case-ignorable, so lowering the joined string
+        # would change Greek final sigma (Σ -> σ instead of ς)
+        return ".".join(map(str.lower, words))
     
     def _to_kebab_case(self, words: list[str]) -> str:
         """kebab-case: all lowercase, hyphen separated."""
-        return "-".join(word.lower() for word in words)
+        return "-".join(words).lower()
     
     def _to_no_case(self, words: list[str]) -> str:
         """no case: all lowercase, space separated."""
-        return " ".join(word.lower() for word in words)
+        return " ".join(words).lower()
     
     def _to_pascal_case(self, words: list[str]) -> str:
         """PascalCase: each word capitalized, no separator."""
-        return "".join(word.capitalize() for word in words)
+        return "".join(map(str.capitalize, words))
     
     def _to_pascal_snake_case(self, words: list[str]) -> str:
         """Pascal_Snake_Case: each word capitalized, underscore separated."""
-        return "_".join(word.capitalize() for word in words)
+        return "_".join(map(str.capitalize, words))
     
     def _to_path_case(self, words: list[str]) -> str:
         """path/case: all lowercase, slash separated."""
-        return "/".join(word.lower() for word in words)
+        return "/".join(words).lower()
     
     def _to_sentence_case(self, words: list[str]) -> str:
         """Sentence case: first word capitalized, rest lowercase, space separated."""
         if not words:
             return ""
-        result = words[0].capitalize()
-        if len(words) > 1:
-            result += " " + " ".join(word.lower() for word in words[1:])
-        return result
+        return " ".join([words[0].capitalize(), *map(str.lower, words[1:])])
     
     def _to_snake_case(self, words: list[str]) -> str:
         """snake_case: all lowercase, underscore separated."""
-        return "_".join(word.lower() for word in words)
+        return "_".join(words).lower()
     
     def _to_train_case(self, words: list[str]) -> str:
         """Train-Case: each word capitalized, hyphen separated."""
-        return "-".join(word.capitalize() for word in words)
\ No newline at end of file
+        return "-".join(map(str.capitalize, words))
\ No newline at end of file
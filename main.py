@@ -1,33 +1,68 @@
 import json
+import os
+import stat
+import time
 import webview
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from webview.dom import DOMEventHandler
 
 from api import API
 from core.config import ConfigManager
+from core.json_codec import json_dumps
 
-SUPPORTED_EXTENSIONS = {
+# Lowercase with leading dot; see _is_supported
+SUPPORTED_EXTENSIONS = frozenset({
     ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif", ".tiff", ".bmp",
     ".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v",
     ".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx",
     ".txt", ".md", ".csv", ".json", ".yaml", ".yml", ".rtf", ".odt", ".ods", ".odp",
     ".html", ".htm", ".xml", ".rss"
-}
+})
+
+
+def _is_supported(name: str) -> bool:
+    """
+    Check a file name's extension against SUPPORTED_EXTENSIONS.
+    
+    Only the final suffix is lowercased. dot > 0 matches Path.suffix, so a
+    bare ".jpg" has no suffix.
+    """
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in SUPPORTED_EXTENSIONS
+
+
+def _js_array(paths: list[str]) -> str:
+    """
+    Serialize paths as a JS array literal.
+    
+    Undecodable bytes in Linux file names surface as lone surrogates, which
+    orjson and UTF-8 encoding reject; json.dumps escapes them instead.
+    """
+    try:
+        return json_dumps(paths).decode()
+    except (TypeError, UnicodeEncodeError):
+        return json.dumps(paths)
 
 
 # Threshold for streaming vs batch file delivery
 STREAM_THRESHOLD = 200
-STREAM_CHUNK_SIZE = 100
+STREAM_CHUNK_SIZE = 500
+# Streamed chunks are flushed at most this often (seconds) unless full
+STREAM_FLUSH_INTERVAL = 0.05
+
+# Concurrent directory listings when streaming large folder drops
+DIR_SCAN_WORKERS = 16
 
 
 def main():
-    # Initialize API
-    api = API()
-    
     # Load config for window settings
     config_manager = ConfigManager()
     config = config_manager.get_sync()
     
+    # Initialize API; settings saved from the UI update the shared manager
+    api = API(config_manager)
+    
     # Create window
     window = webview.create_window(
         title="Pynamer",
@@ -47,22 +82,46 @@ def main():
         window.events.loaded.wait()
 
         def get_drop_depth() -> int:
-            config = ConfigManager().get_sync()
+            # Cached in memory and refreshed by save_config; no file read per drop
+            config = config_manager.get_sync()
             return config.processing.drop_folder_depth if config else 1
 
-        def collect_files_generator(folder: Path, depth: int):
-            """Generator that yields files one at a time to avoid blocking."""
-            if depth < 0:
-                return
+        def scan_directory(folder: str, want_dirs: bool) -> tuple[list[str], list[str]]:
+            """List one directory: (supported files, subdirectories)."""
+            files: list[str] = []
+            subdirs: list[str] = []
             try:
-                for entry in folder.iterdir():
-                    if entry.is_file():
-                        if entry.suffix.lower() in SUPPORTED_EXTENSIONS:
-                            yield str(entry)
-                    elif entry.is_dir() and depth > 0:
-                        yield from collect_files_generator(entry, depth - 1)
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            if _is_supported(entry.name):
+                                files.append(entry.path)
+                        elif want_dirs and entry.is_dir():
+                            subdirs.append(entry.path)
             except PermissionError:
+                pass
+            return files, subdirs
+
+        def collect_files_parallel(folders: list[str], depth: int):
+            """
+            Breadth-first walk that lists directories on a thread pool.
+            Files are yielded as each listing completes, so order is not stable.
+            """
+            if depth < 0 or not folders:
                 return
+            with ThreadPoolExecutor(max_workers=DIR_SCAN_WORKERS) as pool:
+                pending = {
+                    pool.submit(scan_directory, folder, depth > 0): depth
+                    for folder in folders
+                }
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        remaining = pending.pop(future)
+                        files, subdirs = future.result()
+                        yield from files
+                        for subdir in subdirs:
+                            pending[pool.submit(scan_directory, subdir, remaining > 1)] = remaining - 1
 
         def expand_paths_streamed(paths: list[str], on_chunk, on_complete):
             """
@@ -76,26 +135,40 @@ def main():
                 seen: set[str] = set()
                 chunk: list[str] = []
                 total_sent = 0
+                last_flush = time.monotonic()
                 
+                folders: list[str] = []
                 for raw in paths:
                     candidate = Path(raw)
                     if candidate.is_dir():
-                        for file_path in collect_files_generator(candidate, depth):
-                            if file_path not in seen:
-                                seen.add(file_path)
-                                chunk.append(file_path)
-                                
-                                # Send chunk when it reaches threshold
-                                if len(chunk) >= STREAM_CHUNK_SIZE:
-                                    on_chunk(chunk)
-                                    total_sent += len(chunk)
-                                    chunk = []
-                    elif candidate.is_file() and candidate.suffix.lower() in SUPPORTED_EXTENSIONS:
+                        folders.append(str(candidate))
+                    elif candidate.is_file() and _is_supported(candidate.name):
                         file_str = str(candidate)
                         if file_str not in seen:
                             seen.add(file_str)
                             chunk.append(file_str)
                 
+                # A walk of one folder never repeats a path, so the seen set
+                # is only needed when dropped items can overlap
+                folders = list(dict.fromkeys(folders))
+                dedupe = len(folders) > 1 or bool(seen)
+                
+                for file_path in collect_files_parallel(folders, depth):
+                    if dedupe:
+                        if file_path in seen:
+                            continue
+                        seen.add(file_path)
+                    chunk.append(file_path)
+                    
+                    # Send when full, or when the last send is old enough;
+                    # each send is a round trip into the webview
+                    now = time.monotonic()
+                    if len(chunk) >= STREAM_CHUNK_SIZE or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                        on_chunk(chunk)
+                        total_sent += len(chunk)
+                        chunk = []
+                        last_flush = now
+                
                 # Send remaining files
                 if chunk:
                     on_chunk(chunk)
@@ -107,17 +180,19 @@ def main():
             thread.start()
 
         def expand_paths_batch(paths: list[str]) -> list[str]:
-            """Original batch expansion for small drops."""
-            depth = get_drop_depth()
+            """Batch expansion for drops of plain files; folders are streamed."""
             results: list[str] = []
             for raw in paths:
-                candidate = Path(raw)
-                if candidate.is_dir():
-                    for file_path in collect_files_generator(candidate, depth):
-                        results.append(file_path)
-                elif candidate.is_file() and candidate.suffix.lower() in SUPPORTED_EXTENSIONS:
-                    results.append(str(candidate))
-            return sorted(set(results))
+                # One stat per dropped path instead of is_file()
+                try:
+                    mode = os.stat(raw).st_mode
+                except (OSError, ValueError):
+                    continue
+                if stat.S_ISREG(mode):
+                    candidate = Path(raw)
+                    if _is_supported(candidate.name):
+                        results.append(str(candidate))
+            return sorted(dict.fromkeys(results))
 
         def handle_drop(event):
             files = event.get("dataTransfer", {}).get("files", [])
@@ -138,7 +213,7 @@ def main():
                 window.evaluate_js("setStatus('Scanning folders...')")
                 
                 def on_chunk(chunk: list[str]):
-                    window.evaluate_js(f"window.onFilesDropped({json.dumps(chunk)})")
+                    window.evaluate_js(f"window.onFilesDropped({_js_array(chunk)})")
                 
                 def on_complete(total: int):
                     if total > 0:
@@ -151,7 +226,7 @@ def main():
                 # Use simple batch approach for direct file drops
                 expanded = expand_paths_batch(paths)
                 if expanded:
-                    window.evaluate_js(f"window.onFilesDropped({json.dumps(expanded)})")
+                    window.evaluate_js(f"window.onFilesDropped({_js_array(expanded)})")
 
         def swallow_event(_event):
             return None